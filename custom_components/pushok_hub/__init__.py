@@ -50,7 +50,15 @@ if _HA_AVAILABLE:
 
         entry.runtime_data = coordinator
 
-        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        # Entities are only created during platform setup, so platforms
+        # without candidate fields can be skipped entirely
+        detected = coordinator.detect_platforms()
+        coordinator.platforms = [
+            platform for platform in PLATFORMS if platform in detected
+        ]
+        await hass.config_entries.async_forward_entry_setups(
+            entry, coordinator.platforms
+        )
 
         entry.async_on_unload(coordinator.async_shutdown)
 
@@ -66,4 +74,6 @@ if _HA_AVAILABLE:
         Returns:
             True if unload was successful
         """
-        return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+        return await hass.config_entries.async_unload_platforms(
+            entry, entry.runtime_data.platforms
+        )
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import base64
+from binascii import a2b_base64, b2a_base64
 import os
 import logging
 from typing import TYPE_CHECKING
@@ -10,7 +10,6 @@ from typing import TYPE_CHECKING
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import ec
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
-from cryptography.hazmat.backends import default_backend
 
 if TYPE_CHECKING:
     from cryptography.hazmat.primitives.asymmetric.ec import (
@@ -20,10 +19,27 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# AES-GCM IV used for the challenge (12 zero bytes)
+_ZERO_IV = bytes(12)
+
 
 class PushokAuth:
     """Handles ECDSA P-256 authentication with the hub."""
 
+    __slots__ = (
+        "_private_key",
+        "_user_id",
+        "_user_id_b64",
+        "_public_key_bytes",
+        "_gateway_public_key",
+        "_gateway_key_b64",
+        "_shared_key",
+        "_aesgcm",
+        "_dev_nonce",
+        "_iv",
+        "_user_nonce",
+    )
+
     def __init__(
         self,
         private_key_hex: str | None = None,
@@ -38,16 +54,23 @@ class PushokAuth:
         if private_key_hex:
             self._private_key = self._load_private_key(private_key_hex)
         else:
-            self._private_key = ec.generate_private_key(ec.SECP256R1(), default_backend())
+            self._private_key = ec.generate_private_key(ec.SECP256R1())
 
         if user_id:
-            self._user_id = base64.b64decode(user_id)
+            self._user_id = a2b_base64(user_id)
         else:
             self._user_id = os.urandom(32)
+        # Sent with every challenge request
+        self._user_id_b64 = b2a_base64(self._user_id, newline=False).decode("ascii")
+        # Serialized on first use (registration only)
+        self._public_key_bytes: bytes | None = None
 
         self._gateway_public_key: EllipticCurvePublicKey | None = None
+        self._gateway_key_b64: str | None = None  # Key the shared key derives from
         self._shared_key: bytes | None = None
+        self._aesgcm: AESGCM | None = None  # Cipher bound to _shared_key
         self._dev_nonce: bytes | None = None
+        self._iv: bytes | None = None  # dev_nonce[0:12], IV after the challenge
         self._user_nonce: bytes | None = None  # Saved for gateway signature verification
 
     @property
@@ -59,25 +82,27 @@ class PushokAuth:
     @property
     def user_id_b64(self) -> str:
         """Get user ID as base64 string for storage."""
-        return base64.b64encode(self._user_id).decode()
+        return self._user_id_b64
 
     @property
     def public_key_bytes(self) -> bytes:
         """Get public key as uncompressed bytes (65 bytes)."""
-        return self._private_key.public_key().public_bytes(
-            encoding=serialization.Encoding.X962,
-            format=serialization.PublicFormat.UncompressedPoint,
-        )
+        if self._public_key_bytes is None:
+            self._public_key_bytes = self._private_key.public_key().public_bytes(
+                encoding=serialization.Encoding.X962,
+                format=serialization.PublicFormat.UncompressedPoint,
+            )
+        return self._public_key_bytes
 
     @property
     def public_key_b64(self) -> str:
         """Get public key as base64 string for registration."""
-        return base64.b64encode(self.public_key_bytes).decode()
+        return b2a_base64(self.public_key_bytes, newline=False).decode("ascii")
 
     def _load_private_key(self, hex_key: str) -> EllipticCurvePrivateKey:
         """Load private key from hex string."""
         private_value = int(hex_key, 16)
-        return ec.derive_private_key(private_value, ec.SECP256R1(), default_backend())
+        return ec.derive_private_key(private_value, ec.SECP256R1())
 
     def set_gateway_public_key(self, key_b64: str) -> None:
         """Set gateway public key from base64-encoded bytes.
@@ -85,12 +110,18 @@ class PushokAuth:
         Args:
             key_b64: Base64-encoded uncompressed public key (65 bytes)
         """
-        key_bytes = base64.b64decode(key_b64)
+        # Reconnects present the same gateway key; keep the derived secret
+        if key_b64 == self._gateway_key_b64 and self._aesgcm is not None:
+            return
+
+        key_bytes = a2b_base64(key_b64)
         self._gateway_public_key = ec.EllipticCurvePublicKey.from_encoded_point(
             ec.SECP256R1(), key_bytes
         )
         # Compute shared key using ECDH (raw, no HKDF)
         self._shared_key = self._private_key.exchange(ec.ECDH(), self._gateway_public_key)
+        self._aesgcm = AESGCM(self._shared_key)
+        self._gateway_key_b64 = key_b64
 
     def decrypt_challenge(self, encrypted_nonce_b64: str) -> bytes:
         """Decrypt the challenge (dev_nonce) from the hub.
@@ -104,11 +135,10 @@ class PushokAuth:
         if not self._shared_key:
             raise RuntimeError("Gateway public key not set")
 
-        encrypted = base64.b64decode(encrypted_nonce_b64)
+        encrypted = a2b_base64(encrypted_nonce_b64)
         # AES-GCM with IV=0 (12 zero bytes) for challenge
-        aesgcm = AESGCM(self._shared_key)
-        iv = bytes(12)
-        self._dev_nonce = aesgcm.decrypt(iv, encrypted, None)
+        self._dev_nonce = self._aesgcm.decrypt(_ZERO_IV, encrypted, None)
+        self._iv = self._dev_nonce[:12]
         return self._dev_nonce
 
     def create_auth_payload(self) -> str:
@@ -132,11 +162,9 @@ class PushokAuth:
         payload = signature + user_nonce
 
         # Encrypt with AES-GCM, IV = dev_nonce[0:12]
-        aesgcm = AESGCM(self._shared_key)
-        iv = self._dev_nonce[:12]
-        encrypted = aesgcm.encrypt(iv, payload, None)
+        encrypted = self._aesgcm.encrypt(self._iv, payload, None)
 
-        return base64.b64encode(encrypted).decode()
+        return b2a_base64(encrypted, newline=False).decode("ascii")
 
     def verify_gateway_signature(self, encrypted_signature_b64: str) -> bool:
         """Verify the gateway's response signature.
@@ -151,10 +179,8 @@ class PushokAuth:
             raise RuntimeError("Authentication not completed")
 
         try:
-            encrypted = base64.b64decode(encrypted_signature_b64)
-            aesgcm = AESGCM(self._shared_key)
-            iv = self._dev_nonce[:12]
-            decrypted = aesgcm.decrypt(iv, encrypted, None)
+            encrypted = a2b_base64(encrypted_signature_b64)
+            decrypted = self._aesgcm.decrypt(self._iv, encrypted, None)
 
             # Gateway signs user_nonce (the same we sent in authenticate)
             # Signature is in ASN.1 DER format
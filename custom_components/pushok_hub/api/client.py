@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 from typing import Any, Callable
 
@@ -27,6 +26,7 @@ from ..const import (
     ROLE_ADMIN,
 )
 from .auth import PushokAuth
+from .json_utils import JSONDecodeError, json_dumps, json_loads
 from .models import (
     DeviceAdapter,
     DeviceAttributes,
@@ -57,6 +57,24 @@ class CommandError(PushokHubError):
 class PushokHubClient:
     """WebSocket client for Pushok Hub."""
 
+    __slots__ = (
+        "_host",
+        "_port",
+        "_use_ssl",
+        "_path",
+        "_auth",
+        "_ws",
+        "_connected",
+        "_authorized",
+        "_role",
+        "_command_id",
+        "_pending_commands",
+        "_receive_task",
+        "_broadcast_callback",
+        "_event_callbacks",
+        "_connection_lost_callback",
+    )
+
     def __init__(
         self,
         host: str,
@@ -85,6 +103,7 @@ class PushokHubClient:
         self._pending_commands: dict[int, asyncio.Future[dict[str, Any]]] = {}
         self._receive_task: asyncio.Task | None = None
         self._broadcast_callback: Callable[[dict[str, Any]], None] | None = None
+        self._event_callbacks: dict[str, Callable[[dict[str, Any]], None]] = {}
         self._connection_lost_callback: Callable[[], None] | None = None
         self._connected = False
         self._authorized = False
@@ -115,6 +134,22 @@ class PushokHubClient:
         """
         self._broadcast_callback = callback
 
+    def set_event_callback(
+        self, evt: str, callback: Callable[[dict[str, Any]], None] | None
+    ) -> None:
+        """Set callback for broadcasts of a specific event.
+
+        Takes precedence over the generic broadcast callback for that event.
+
+        Args:
+            evt: Broadcast event name (e.g., "object_update")
+            callback: Function to call when the event is received
+        """
+        if callback is None:
+            self._event_callbacks.pop(evt, None)
+        else:
+            self._event_callbacks[evt] = callback
+
     def set_connection_lost_callback(
         self, callback: Callable[[], None] | None
     ) -> None:
@@ -133,10 +168,12 @@ class PushokHubClient:
         _LOGGER.debug("Connecting to %s", uri)
 
         try:
+            # Frames are small JSON on a LAN link; skip per-message deflate
             self._ws = await websockets.connect(
                 uri,
                 ping_interval=10,
                 ping_timeout=15,
+                compression=None,
             )
             self._connected = True
             self._receive_task = asyncio.create_task(self._receive_loop())
@@ -181,17 +218,21 @@ class PushokHubClient:
         If user is not registered and hub is in free access mode (no users),
         this will automatically register the user.
         """
-        # Step 1: Get gateway public key
-        response = await self._send_command(CMD_PUB_KEY)
-        gateway_key = response["result"]["key"]
-        self._auth.set_gateway_public_key(gateway_key)
-
-        # Step 2: Send challenge with user_id
-        response = await self._send_command(
-            CMD_CHALLENGE,
-            {"user_id": self._auth.user_id_b64},
+        # Steps 1-2 are independent, so pipeline them in one round-trip:
+        # get gateway public key and send challenge with user_id
+        key_response, challenge_response = await self._send_many(
+            [
+                (CMD_PUB_KEY, None),
+                (CMD_CHALLENGE, {"user_id": self._auth.user_id_b64}),
+            ]
         )
-        encrypted_nonce = response["result"]
+        gateway_key = key_response["result"]["key"]
+        # ECDH and ECDSA signing are CPU-bound; keep them off the event loop
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, self._auth.set_gateway_public_key, gateway_key
+        )
+        encrypted_nonce = challenge_response["result"]
 
         # Try to decrypt challenge - may fail if user not registered
         try:
@@ -203,7 +244,9 @@ class PushokHubClient:
             return
 
         # Step 3: Authenticate with signed payload
-        auth_payload = self._auth.create_auth_payload()
+        auth_payload = await loop.run_in_executor(
+            None, self._auth.create_auth_payload
+        )
         response = await self._send_command(
             CMD_AUTHENTICATE,
             {"password": auth_payload, "version": "0.1.0"},
@@ -264,15 +307,17 @@ class PushokHubClient:
         self._command_id += 1
         cmd_id = self._command_id
 
-        command = {"id": cmd_id, "m": method}
-        if params:
-            command["p"] = params
+        command = (
+            {"id": cmd_id, "m": method, "p": params}
+            if params
+            else {"id": cmd_id, "m": method}
+        )
 
-        future: asyncio.Future[dict[str, Any]] = asyncio.get_event_loop().create_future()
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
         self._pending_commands[cmd_id] = future
 
         try:
-            await self._ws.send(json.dumps(command))
+            await self._ws.send(json_dumps(command))
             response = await asyncio.wait_for(future, timeout)
 
             if "error" in response:
@@ -285,6 +330,30 @@ class PushokHubClient:
         finally:
             self._pending_commands.pop(cmd_id, None)
 
+    async def _send_many(
+        self,
+        commands: list[tuple[str, dict[str, Any] | None]],
+        timeout: float = COMMAND_TIMEOUT,
+    ) -> list[dict[str, Any]]:
+        """Send several independent commands and wait for all responses.
+
+        All commands are written before any response is awaited, so the
+        batch costs a single round-trip instead of one per command.
+
+        Args:
+            commands: List of (method, params) tuples
+            timeout: Response timeout in seconds
+
+        Returns:
+            Response dicts in the same order as commands
+        """
+        return await asyncio.gather(
+            *(
+                self._send_command(method, params, timeout)
+                for method, params in commands
+            )
+        )
+
     async def _receive_loop(self) -> None:
         """Receive messages from WebSocket."""
         if not self._ws:
@@ -299,8 +368,8 @@ class PushokHubClient:
                         continue
 
                     try:
-                        data = json.loads(message)
-                    except json.JSONDecodeError:
+                        data = json_loads(message)
+                    except JSONDecodeError:
                         _LOGGER.warning("Invalid JSON received: %s", message[:100])
                         continue
 
@@ -309,12 +378,11 @@ class PushokHubClient:
                         self._handle_broadcast(data["broadcast"])
                         continue
 
-                    # Check if it's a command response
-                    cmd_id = data.get("id")
-                    if cmd_id and cmd_id in self._pending_commands:
-                        future = self._pending_commands[cmd_id]
-                        if not future.done():
-                            future.set_result(data)
+                    # Check if it's a command response (single lookup; the
+                    # sender's cleanup pop is then a no-op)
+                    future = self._pending_commands.pop(data.get("id"), None)
+                    if future is not None and not future.done():
+                        future.set_result(data)
                 except Exception:
                     # Errors raised by handlers (e.g. HA state validation) must not
                     # tear down the receive loop or be misread as connection loss.
@@ -337,8 +405,9 @@ class PushokHubClient:
         evt = data.get("evt")
         _LOGGER.debug("Received broadcast: %s", evt)
 
-        if self._broadcast_callback:
-            self._broadcast_callback(data)
+        callback = self._event_callbacks.get(evt, self._broadcast_callback)
+        if callback:
+            callback(data)
 
     # High-level API methods
 
@@ -354,10 +423,19 @@ class PushokHubClient:
             List of device descriptions
         """
         response = await self._send_command(CMD_LIST_OBJECTS, {"type": entity_type})
+        items = response.get("result", ())
+        parse = DeviceDescription.from_dict
+        try:
+            # Common case: every entry is valid
+            return list(map(parse, items))
+        except Exception:
+            pass
+
+        # Slow path: skip malformed entries one by one
         devices = []
-        for item in response.get("result", []):
+        for item in items:
             try:
-                devices.append(DeviceDescription.from_dict(item))
+                devices.append(parse(item))
             except Exception as e:
                 _LOGGER.warning("Failed to parse device: %s", e)
         return devices
@@ -435,8 +513,7 @@ class PushokHubClient:
         result = response.get("result", {})
         # Result may be a JSON string, parse it
         if isinstance(result, str):
-            import json
-            result = json.loads(result)
+            result = json_loads(result)
         return DeviceAttributes.from_dict(result)
 
     async def get_format(
@@ -0,0 +1,32 @@
+"""JSON helpers for Pushok Hub API, using orjson when available."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # Standalone use without orjson installed
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# catch this regardless of the backend in use
+JSONDecodeError = json.JSONDecodeError
+
+
+if orjson is not None:
+
+    def json_dumps(obj: Any) -> str:
+        """Serialize obj to a compact JSON string."""
+        return orjson.dumps(obj).decode()
+
+    json_loads = orjson.loads
+
+else:
+
+    def json_dumps(obj: Any) -> str:
+        """Serialize obj to a compact JSON string."""
+        return json.dumps(obj, separators=(",", ":"))
+
+    json_loads = json.loads
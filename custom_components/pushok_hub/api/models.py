@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, NamedTuple
 
+from ..const import DATA_TYPE_BOOL, DATA_TYPE_FLOAT, MAX_FIELD_ID
+from .json_utils import json_loads
 
-@dataclass
+
+@dataclass(slots=True)
 class PropertyValue:
     """Represents a device property value."""
 
@@ -17,14 +20,12 @@ class PropertyValue:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> PropertyValue:
         """Create PropertyValue from dict."""
-        return cls(
-            value=data.get("value"),
-            time=data.get("time"),
-            ack=data.get("ack", False),
-        )
+        # Positional construction: this runs for every field of every broadcast
+        get = data.get
+        return cls(get("value"), get("time"), get("ack", False))
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceDescription:
     """Represents a Zigbee device description."""
 
@@ -60,31 +61,29 @@ class DeviceDescription:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceAttributes:
     """Represents device user-defined attributes."""
 
     name: str | None = None
-    tags: list[str] = field(default_factory=list)
+    tags: tuple[str, ...] = ()  # Shared empty tuple when the device has none
     params_visibility: dict[int, bool] = field(default_factory=dict)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> DeviceAttributes:
         """Create DeviceAttributes from API response."""
-        # Handle case where data might not be a dict
-        if not isinstance(data, dict):
-            return cls(name=None, tags=[], params_visibility={})
+        try:
+            pv = data.get("paramsVisibility")
+        except AttributeError:
+            # Malformed response (not a dict)
+            return cls(name=None, tags=(), params_visibility={})
 
-        visibility = {}
-        if "paramsVisibility" in data:
-            pv = data["paramsVisibility"]
-            if isinstance(pv, dict):
-                for k, v in pv.items():
-                    visibility[int(k)] = v
+        visibility = {int(k): v for k, v in pv.items()} if isinstance(pv, dict) else {}
+        tags = data.get("tags")
 
         return cls(
             name=data.get("name"),
-            tags=data.get("tags", []),
+            tags=tuple(tags) if isinstance(tags, (list, tuple)) else (),
             params_visibility=visibility,
         )
 
@@ -92,12 +91,12 @@ class DeviceAttributes:
         """Convert to dict for API request."""
         return {
             "name": self.name,
-            "tags": self.tags,
+            "tags": list(self.tags),
             "paramsVisibility": {str(k): v for k, v in self.params_visibility.items()},
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceState:
     """Represents device state with all properties."""
 
@@ -108,90 +107,114 @@ class DeviceState:
     @classmethod
     def from_dict(cls, device_id: str, data: dict[str, Any]) -> DeviceState:
         """Create DeviceState from API response."""
-        properties = {}
-        adapter_crc = None
-
-        # Handle case where data might not be a dict
-        if not isinstance(data, dict):
+        try:
+            items = data.items()
+        except AttributeError:
+            # Malformed response (not a dict)
             return cls(device_id=device_id, properties={}, adapter_crc=None)
 
-        # Make a copy to avoid modifying original
-        data = dict(data)
-        adapter_crc = data.pop("adptr-crc", None)
-
-        for key, value in data.items():
-            if key.isdigit() and isinstance(value, dict):
-                properties[int(key)] = PropertyValue.from_dict(value)
+        # Field IDs are the digit keys; metadata such as "adptr-crc" is not.
+        # PropertyValue.from_dict is inlined to save a call per property.
+        properties = {
+            int(key): PropertyValue(
+                value.get("value"), value.get("time"), value.get("ack", False)
+            )
+            for key, value in items
+            if isinstance(value, dict) and key.isdigit()
+        }
 
         return cls(
             device_id=device_id,
             properties=properties,
-            adapter_crc=adapter_crc,
+            adapter_crc=data.get("adptr-crc"),
         )
 
 
-@dataclass
-class FieldFormat:
-    """Represents a device field format/metadata."""
+class FieldFormat(NamedTuple):
+    """Represents a device field format/metadata.
+
+    Stores the packed metadata value as received; the individual parts are
+    unpacked on access.
+    """
 
     field_id: int
-    data_type: int
-    access: int
-    field_type: int
+    raw: int
 
     @classmethod
     def from_raw(cls, field_id: int, raw: int) -> FieldFormat:
         """Create FieldFormat from raw metadata value."""
-        return cls(
-            field_id=field_id,
-            data_type=raw & 0xFF,
-            access=(raw >> 8) & 0xFF,
-            field_type=(raw >> 16) & 0xFF,
-        )
+        return cls(field_id, raw)
+
+    @property
+    def data_type(self) -> int:
+        """Get field data type (DATA_TYPE_*)."""
+        return self.raw & 0xFF
+
+    @property
+    def access(self) -> int:
+        """Get field access flags."""
+        return (self.raw >> 8) & 0xFF
+
+    @property
+    def field_type(self) -> int:
+        """Get field type."""
+        return (self.raw >> 16) & 0xFF
 
     @property
     def is_read_only(self) -> bool:
         """Check if field is read-only."""
-        return self.access == 0
+        return self.raw & 0xFF00 == 0
 
     @property
     def is_bool(self) -> bool:
         """Check if field is boolean type."""
-        from ..const import DATA_TYPE_BOOL
-        return self.data_type == DATA_TYPE_BOOL
+        return self.raw & 0xFF == DATA_TYPE_BOOL
 
     @property
     def is_numeric(self) -> bool:
         """Check if field is numeric type."""
-        from ..const import DATA_TYPE_FLOAT
-        return self.data_type <= DATA_TYPE_FLOAT
+        return self.raw & 0xFF <= DATA_TYPE_FLOAT
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceFormat:
     """Represents device format with all fields."""
 
     device_id: str
     fields: dict[int, FieldFormat] = field(default_factory=dict)
+    # Non-service numeric read-only fields, i.e. fallback sensor candidates
+    sensor_field_ids: tuple[int, ...] = ()
 
     @classmethod
     def from_dict(cls, device_id: str, data: dict[str, Any]) -> DeviceFormat:
         """Create DeviceFormat from API response."""
-        fields = {}
-
-        # Handle case where data might not be a dict
-        if not isinstance(data, dict):
+        try:
+            items = data.items()
+        except AttributeError:
+            # Malformed response (not a dict)
             return cls(device_id=device_id, fields={})
 
-        for key, value in data.items():
-            if key.isdigit() and isinstance(value, int):
-                field_id = int(key)
-                fields[field_id] = FieldFormat.from_raw(field_id, value)
+        fields = {
+            field_id: FieldFormat(field_id, value)
+            for key, value in items
+            if isinstance(value, int) and key.isdigit()
+            for field_id in (int(key),)
+        }
 
-        return cls(device_id=device_id, fields=fields)
+        sensor_field_ids = tuple(
+            field_id
+            for field_id, field_fmt in fields.items()
+            if field_id <= MAX_FIELD_ID
+            and field_fmt.is_numeric
+            and field_fmt.is_read_only
+        )
+
+        return cls(
+            device_id=device_id, fields=fields, sensor_field_ids=sensor_field_ids
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class AdapterParam:
     """Represents a parameter definition from device adapter."""
 
@@ -206,6 +229,29 @@ class AdapterParam:
     view_params: dict[str, Any] = field(default_factory=dict)
     convert: dict[str, Any] | None = None
     ya: Any = None  # Can be string or dict for Yandex Smart Home mapping
+    # Access flags, derived from access on construction
+    is_readable: bool = field(init=False, repr=False, compare=False)
+    is_writable: bool = field(init=False, repr=False, compare=False)
+    # Reverse of labels (value -> label), shared by all entities of the param
+    value_to_label: dict[Any, str] = field(init=False, repr=False, compare=False)
+    # viewParams.type ("slider", "dropdown", ...; "" if unset)
+    view_type: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Derive access flags and label lookup once instead of per use."""
+        self.is_readable = "r" in self.access
+        self.is_writable = "w" in self.access
+        self.view_type = self.view_params.get("type", "")
+        value_to_label: dict[Any, str] = {}
+        if isinstance(self.labels, dict):
+            for label, value in self.labels.items():
+                try:
+                    value_to_label[value] = label
+                except TypeError:
+                    # Unhashable label value (list/dict); it cannot match a
+                    # device value, so only the reverse lookup skips it
+                    continue
+        self.value_to_label = value_to_label
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> AdapterParam:
@@ -225,18 +271,8 @@ class AdapterParam:
             ya=data.get("ya"),
         )
 
-    @property
-    def is_readable(self) -> bool:
-        """Check if parameter is readable."""
-        return "r" in self.access
-
-    @property
-    def is_writable(self) -> bool:
-        """Check if parameter is writable."""
-        return "w" in self.access
-
 
-@dataclass
+@dataclass(slots=True)
 class DeviceAdapter:
     """Represents full device adapter with parameters and metadata."""
 
@@ -245,9 +281,50 @@ class DeviceAdapter:
     description: str | None = None
     device_type: str | None = None
     url: str | None = None
-    params: list[AdapterParam] = field(default_factory=list)
+    params: dict[int, AdapterParam] = field(default_factory=dict)  # By address
     ya_device_type: Any = None  # Yandex device type mapping
     raw_content: dict[str, Any] = field(default_factory=dict)
+    # Non-service params (address <= MAX_FIELD_ID), in address order
+    public_params: tuple[AdapterParam, ...] = field(
+        init=False, repr=False, compare=False
+    )
+    # Non-service params partitioned by type and access, in address order
+    bool_ro: list[AdapterParam] = field(init=False, repr=False, compare=False)
+    bool_rw: list[AdapterParam] = field(init=False, repr=False, compare=False)
+    numeric_ro: list[AdapterParam] = field(init=False, repr=False, compare=False)
+    numeric_rw: list[AdapterParam] = field(init=False, repr=False, compare=False)
+    # Non-service writable params with labels shown as a dropdown
+    dropdowns: list[AdapterParam] = field(init=False, repr=False, compare=False)
+    # Param lookup by name, built from params on construction
+    _by_name: dict[str, AdapterParam] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Index params by name (first occurrence wins) and partition them."""
+        self._by_name = {}
+        self.bool_ro = []
+        self.bool_rw = []
+        self.numeric_ro = []
+        self.numeric_rw = []
+        self.dropdowns = []
+        public_params = []
+        for param in self.params.values():
+            if param.name is not None:
+                self._by_name.setdefault(param.name, param)
+
+            # Skip service fields (ID > MAX_FIELD_ID)
+            if param.address > MAX_FIELD_ID:
+                continue
+            public_params.append(param)
+            if param.is_writable and param.labels and param.view_type == "dropdown":
+                self.dropdowns.append(param)
+            if param.param_type == "bool":
+                group = self.bool_rw if param.is_writable else self.bool_ro
+            elif param.param_type in ("int", "float"):
+                group = self.numeric_rw if param.is_writable else self.numeric_ro
+            else:
+                continue
+            group.append(param)
+        self.public_params = tuple(public_params)
 
     @classmethod
     def from_response(cls, driver: str, data: dict[str, Any]) -> DeviceAdapter:
@@ -257,23 +334,23 @@ class DeviceAdapter:
             driver: Driver name (e.g., "contact")
             data: Response from getAdapter command containing "content" and "crc"
         """
-        import json
-
         crc = data.get("crc", 0)
         content_str = data.get("content", "{}")
 
         # Parse JSON content
         if isinstance(content_str, str):
-            content = json.loads(content_str)
+            content = json_loads(content_str)
         else:
             content = content_str
 
-        params = []
+        params: dict[int, AdapterParam] = {}
         for param_data in content.get("params", []):
             try:
-                params.append(AdapterParam.from_dict(param_data))
+                param = AdapterParam.from_dict(param_data)
             except (KeyError, TypeError):
                 continue
+            # Keep the first definition of an address
+            params.setdefault(param.address, param)
 
         return cls(
             driver=driver,
@@ -288,14 +365,8 @@ class DeviceAdapter:
 
     def get_param_by_address(self, address: int) -> AdapterParam | None:
         """Get parameter by address."""
-        for param in self.params:
-            if param.address == address:
-                return param
-        return None
+        return self.params.get(address)
 
     def get_param_by_name(self, name: str) -> AdapterParam | None:
         """Get parameter by name."""
-        for param in self.params:
-            if param.name == name:
-                return param
-        return None
+        return self._by_name.get(name)
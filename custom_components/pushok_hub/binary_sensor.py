@@ -9,16 +9,44 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
 )
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, BINARY_SENSOR_DEVICE_CLASS_MAPPING, MAX_FIELD_ID
+from .const import DOMAIN, BINARY_SENSOR_DEVICE_CLASS_MAPPING
 from .coordinator import PushokHubCoordinator
 from .entity import PushokHubEntity
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _build_device_class_map() -> dict[str, BinarySensorDeviceClass]:
+    """Resolve BINARY_SENSOR_DEVICE_CLASS_MAPPING to enum members once."""
+    device_classes: dict[str, BinarySensorDeviceClass] = {}
+    for param_name, device_class_str in BINARY_SENSOR_DEVICE_CLASS_MAPPING.items():
+        try:
+            device_classes[param_name] = BinarySensorDeviceClass(device_class_str)
+        except ValueError:
+            continue
+    return device_classes
+
+
+# Param name (lowercase) -> BinarySensorDeviceClass
+_DEVICE_CLASS_BY_PARAM = _build_device_class_map()
+
+# Param name token -> icon, in priority order (first match wins)
+_ICON_BY_TOKEN: dict[str, str] = {
+    "motion": "mdi:motion-sensor",
+    "presence": "mdi:motion-sensor",
+    "door": "mdi:door",
+    "window": "mdi:door",
+    "contact": "mdi:door",
+    "smoke": "mdi:smoke-detector",
+    "water": "mdi:water-alert",
+    "leak": "mdi:water-alert",
+}
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -33,33 +61,10 @@ async def async_setup_entry(
     """
     coordinator: PushokHubCoordinator = entry.runtime_data
 
-    entities: list[PushokHubBinarySensor] = []
-
-    for device_id, device in coordinator.devices.items():
-        # First try to use adapter params (more complete info)
-        adapter = coordinator.get_adapter_for_device(device_id)
-        if adapter and adapter.params:
-            for param in adapter.params:
-                # Skip service fields (ID > MAX_FIELD_ID)
-                if param.address > MAX_FIELD_ID:
-                    continue
-                # Create binary sensor for boolean read-only params
-                if param.param_type == "bool" and not param.is_writable:
-                    entities.append(
-                        PushokHubBinarySensor(coordinator, device, param.address)
-                    )
-        else:
-            # Fallback to format if no adapter
-            fmt = coordinator.formats.get(device_id)
-            if fmt:
-                for field_id, field_fmt in fmt.fields.items():
-                    # Skip service fields (ID > MAX_FIELD_ID)
-                    if field_id > MAX_FIELD_ID:
-                        continue
-                    if field_fmt.is_bool and field_fmt.is_read_only:
-                        entities.append(
-                            PushokHubBinarySensor(coordinator, device, field_id)
-                        )
+    entities = [
+        PushokHubBinarySensor(coordinator, device, field_id)
+        for device, field_id in coordinator.platform_fields(Platform.BINARY_SENSOR)
+    ]
 
     async_add_entities(entities)
 
@@ -74,25 +79,18 @@ class PushokHubBinarySensor(PushokHubEntity, BinarySensorEntity):
         # Set device class based on param name
         if self._adapter_param and self._adapter_param.name:
             param_name = self._adapter_param.name.lower()
-            device_class_str = BINARY_SENSOR_DEVICE_CLASS_MAPPING.get(param_name)
-            if device_class_str:
-                try:
-                    self._attr_device_class = BinarySensorDeviceClass(device_class_str)
-                except ValueError:
-                    pass
+            device_class = _DEVICE_CLASS_BY_PARAM.get(param_name)
+            if device_class:
+                self._attr_device_class = device_class
 
         # Set icon based on device class or param name
         if not hasattr(self, "_attr_device_class") or self._attr_device_class is None:
             if self._adapter_param and self._adapter_param.name:
                 name = self._adapter_param.name.lower()
-                if "motion" in name or "presence" in name:
-                    self._attr_icon = "mdi:motion-sensor"
-                elif "door" in name or "window" in name or "contact" in name:
-                    self._attr_icon = "mdi:door"
-                elif "smoke" in name:
-                    self._attr_icon = "mdi:smoke-detector"
-                elif "water" in name or "leak" in name:
-                    self._attr_icon = "mdi:water-alert"
+                for token, icon in _ICON_BY_TOKEN.items():
+                    if token in name:
+                        self._attr_icon = icon
+                        break
 
     @property
     def is_on(self) -> bool | None:
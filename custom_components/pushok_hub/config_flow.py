@@ -66,6 +66,54 @@ class PushokHubConfigFlow(ConfigFlow, domain=DOMAIN):
         super().__init__()
         self._reconfig_entry_id: str | None = None
 
+    async def _async_probe(
+        self,
+        host: str,
+        port: int,
+        use_ssl: bool,
+        auth: PushokAuth,
+        path: str = "",
+    ) -> str | None:
+        """Test that the hub accepts a connection with the given auth.
+
+        Args:
+            host: Hub or remote gateway host
+            port: Port
+            use_ssl: Whether to use wss://
+            auth: Authentication handler
+            path: WebSocket path (remote connections)
+
+        Returns:
+            Error key for the form, or None on success
+        """
+        client = PushokHubClient(
+            host=host,
+            port=port,
+            use_ssl=use_ssl,
+            path=path,
+            auth=auth,
+        )
+
+        try:
+            await client.connect()
+            await client.disconnect()
+        except Exception as e:
+            if path:
+                _LOGGER.error("Failed to connect to hub via remote gateway: %s", e)
+            else:
+                _LOGGER.error("Failed to connect to hub: %s", e)
+            return "cannot_connect"
+
+        return None
+
+    async def _async_stored_auth(self, entry: ConfigEntry) -> PushokAuth:
+        """Load the auth keys stored in a config entry."""
+        return await self.hass.async_add_executor_job(
+            PushokAuth,
+            entry.data[STORAGE_KEY_PRIVATE_KEY],
+            entry.data[STORAGE_KEY_USER_ID],
+        )
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -81,19 +129,11 @@ class PushokHubConfigFlow(ConfigFlow, domain=DOMAIN):
             await self.async_set_unique_id(f"{host}:{port}")
             self._abort_if_unique_id_configured()
 
-            # Test connection
-            auth = PushokAuth()
-            client = PushokHubClient(
-                host=host,
-                port=port,
-                use_ssl=use_ssl,
-                auth=auth,
-            )
-
-            try:
-                await client.connect()
-                await client.disconnect()
+            # Test connection with a new key pair (generation is CPU-bound)
+            auth = await self.hass.async_add_executor_job(PushokAuth)
+            error = await self._async_probe(host, port, use_ssl, auth)
 
+            if error is None:
                 # Create entry with auth keys
                 name = user_input.get(CONF_NAME) or f"Pushok Hub ({host})"
 
@@ -109,9 +149,7 @@ class PushokHubConfigFlow(ConfigFlow, domain=DOMAIN):
                     },
                 )
 
-            except Exception as e:
-                _LOGGER.error("Failed to connect to hub: %s", e)
-                errors["base"] = "cannot_connect"
+            errors["base"] = error
 
         return self.async_show_form(
             step_id="user",
@@ -133,20 +171,13 @@ class PushokHubConfigFlow(ConfigFlow, domain=DOMAIN):
             await self.async_set_unique_id(f"remote:{hub_id}")
             self._abort_if_unique_id_configured()
 
-            # Test connection
-            auth = PushokAuth()
-            client = PushokHubClient(
-                host=REMOTE_GATEWAY_HOST,
-                port=REMOTE_GATEWAY_PORT,
-                use_ssl=True,
-                path=path,
-                auth=auth,
+            # Test connection with a new key pair (generation is CPU-bound)
+            auth = await self.hass.async_add_executor_job(PushokAuth)
+            error = await self._async_probe(
+                REMOTE_GATEWAY_HOST, REMOTE_GATEWAY_PORT, True, auth, path
             )
 
-            try:
-                await client.connect()
-                await client.disconnect()
-
+            if error is None:
                 # Create entry with auth keys
                 name = user_input.get(CONF_NAME) or f"Pushok Hub (Remote)"
 
@@ -163,9 +194,7 @@ class PushokHubConfigFlow(ConfigFlow, domain=DOMAIN):
                     },
                 )
 
-            except Exception as e:
-                _LOGGER.error("Failed to connect to hub via remote gateway: %s", e)
-                errors["base"] = "cannot_connect"
+            errors["base"] = error
 
         return self.async_show_form(
             step_id="remote",
@@ -244,22 +273,19 @@ class PushokHubConfigFlow(ConfigFlow, domain=DOMAIN):
             port = user_input.get(CONF_PORT, DEFAULT_PORT)
             use_ssl = user_input.get(CONF_USE_SSL, DEFAULT_USE_SSL)
 
-            # Test connection with existing auth keys
-            auth = PushokAuth(
-                private_key_hex=entry.data[STORAGE_KEY_PRIVATE_KEY],
-                user_id=entry.data[STORAGE_KEY_USER_ID],
+            # Test connection with existing auth keys, unless the entry
+            # already uses these connection settings
+            error = None
+            unchanged = not entry.data.get(CONF_REMOTE_MODE, False) and (
+                (host, port, use_ssl) == (current_host, current_port, current_ssl)
             )
-            client = PushokHubClient(
-                host=host,
-                port=port,
-                use_ssl=use_ssl,
-                auth=auth,
-            )
-
-            try:
-                await client.connect()
-                await client.disconnect()
+            if unchanged:
+                _LOGGER.debug("Connection settings unchanged, skipping probe")
+            else:
+                auth = await self._async_stored_auth(entry)
+                error = await self._async_probe(host, port, use_ssl, auth)
 
+            if error is None:
                 # Update entry
                 return self.async_update_reload_and_abort(
                     entry,
@@ -273,9 +299,7 @@ class PushokHubConfigFlow(ConfigFlow, domain=DOMAIN):
                     },
                 )
 
-            except Exception as e:
-                _LOGGER.error("Failed to connect to hub: %s", e)
-                errors["base"] = "cannot_connect"
+            errors["base"] = error
 
         return self.async_show_form(
             step_id="reconfigure_local",
@@ -308,23 +332,18 @@ class PushokHubConfigFlow(ConfigFlow, domain=DOMAIN):
             hub_id = user_input[CONF_HUB_ID]
             path = _build_remote_path(hub_id)
 
-            # Test connection with existing auth keys
-            auth = PushokAuth(
-                private_key_hex=entry.data[STORAGE_KEY_PRIVATE_KEY],
-                user_id=entry.data[STORAGE_KEY_USER_ID],
-            )
-            client = PushokHubClient(
-                host=REMOTE_GATEWAY_HOST,
-                port=REMOTE_GATEWAY_PORT,
-                use_ssl=True,
-                path=path,
-                auth=auth,
-            )
-
-            try:
-                await client.connect()
-                await client.disconnect()
+            # Test connection with existing auth keys, unless the entry
+            # already uses this hub
+            error = None
+            if entry.data.get(CONF_REMOTE_MODE, False) and hub_id == current_hub_id:
+                _LOGGER.debug("Connection settings unchanged, skipping probe")
+            else:
+                auth = await self._async_stored_auth(entry)
+                error = await self._async_probe(
+                    REMOTE_GATEWAY_HOST, REMOTE_GATEWAY_PORT, True, auth, path
+                )
 
+            if error is None:
                 # Update entry
                 return self.async_update_reload_and_abort(
                     entry,
@@ -339,9 +358,7 @@ class PushokHubConfigFlow(ConfigFlow, domain=DOMAIN):
                     },
                 )
 
-            except Exception as e:
-                _LOGGER.error("Failed to connect to hub via remote gateway: %s", e)
-                errors["base"] = "cannot_connect"
+            errors["base"] = error
 
         return self.async_show_form(
             step_id="reconfigure_remote",
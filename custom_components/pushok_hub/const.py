@@ -60,7 +60,16 @@ EVT_DEVICE_STATE_CHANGE: Final = "device_state_change"
 
 # Timeouts
 COMMAND_TIMEOUT: Final = 5.0
-RECONNECT_INTERVAL: Final = 10.0
+# Per-device requests in flight at once while loading devices; more would
+# queue on the hub and run into COMMAND_TIMEOUT on large installations
+MAX_CONCURRENT_REQUESTS: Final = 8
+# Window for collapsing rapid writes to the same field into one setState
+WRITE_DEBOUNCE: Final = 0.05
+# Window for coalescing listener notifications from bursts of broadcasts
+UPDATE_COALESCE: Final = 0.05
+# Reconnect backoff: delay doubles after each failed attempt, capped at max
+RECONNECT_BASE: Final = 1.0
+RECONNECT_MAX: Final = 300.0
 
 # Storage
 STORAGE_KEY_PRIVATE_KEY: Final = "ec_private_key"
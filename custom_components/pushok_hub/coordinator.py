@@ -4,15 +4,25 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
+import re
 from datetime import timedelta
-from typing import Any
+from typing import Any, Awaitable, Callable, TypeVar
 
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .api import PushokHubClient, PushokAuth
-from .api.models import DeviceAdapter, DeviceAttributes, DeviceDescription, DeviceFormat, DeviceState
+from .api.models import (
+    DeviceAdapter,
+    DeviceAttributes,
+    DeviceDescription,
+    DeviceFormat,
+    DeviceState,
+    PropertyValue,
+)
 from .const import (
     DOMAIN,
     CONF_HOST,
@@ -24,13 +34,48 @@ from .const import (
     DEFAULT_USE_SSL,
     ENTITY_TYPE_ZIGBEE,
     EVT_OBJECT_UPDATE,
-    RECONNECT_INTERVAL,
+    MAX_CONCURRENT_REQUESTS,
+    MAX_FIELD_ID,
+    RECONNECT_BASE,
+    RECONNECT_MAX,
     STORAGE_KEY_PRIVATE_KEY,
     STORAGE_KEY_USER_ID,
+    UPDATE_COALESCE,
+    WRITE_DEBOUNCE,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Adapter device types whose writable bools belong to the light platform
+_LIGHT_DEVICE_TYPE_RE = re.compile(r"light|dimmer|bulb")
+
+# Param view types shown as number entities
+_NUMBER_VIEW_TYPES = frozenset({"slider", "value"})
+
+
+def _parse_object_update(data: dict[str, Any]) -> tuple[str, dict[str, Any]] | None:
+    """Validate an object_update broadcast and extract its payload.
+
+    Args:
+        data: Broadcast message data
+
+    Returns:
+        Tuple of (device_id, props), or None if the message is malformed
+    """
+    device_id = data.get("id")
+    if not device_id or not isinstance(device_id, str):
+        return None
+
+    props = data.get("props")
+    if props is None:
+        return device_id, {}
+    if not isinstance(props, dict):
+        return None
+
+    return device_id, props
+
 
 class PushokHubCoordinator(DataUpdateCoordinator[dict[str, DeviceState]]):
     """Coordinator for Pushok Hub data.
@@ -59,10 +104,28 @@ class PushokHubCoordinator(DataUpdateCoordinator[dict[str, DeviceState]]):
         self.config_entry = entry
         self._client: PushokHubClient | None = None
         self._reconnect_task: asyncio.Task | None = None
+        # Bounds per-device requests to the hub across concurrent loads
+        self._request_limit = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
         self._devices: dict[str, DeviceDescription] = {}
         self._formats: dict[str, DeviceFormat] = {}
         self._attributes: dict[str, DeviceAttributes] = {}
         self._adapters: dict[str, DeviceAdapter] = {}  # Cached by driver name
+        self._devices_by_driver: dict[str, list[DeviceDescription]] = {}
+        self._device_adapters: dict[str, DeviceAdapter] = {}  # By device ID
+        # Platform -> (device, field ID) pairs, rebuilt on each device load
+        self._platform_fields: dict[Platform, list[tuple[DeviceDescription, int]]] = {}
+        # Debounced writes keyed by (device_id, field); latest value wins
+        self._pending_writes: dict[tuple[str, int], asyncio.Task[bool]] = {}
+        self._pending_values: dict[tuple[str, int], Any] = {}
+        self._notify_handle: asyncio.TimerHandle | None = None
+        # Platforms set up for this entry (see detect_platforms)
+        self.platforms: list[Platform] = []
+        # Sensor metadata by (driver, adapter CRC, field ID), shared by the
+        # sensors of this entry (see sensor.py)
+        self.sensor_specs: dict[tuple[str, int, int], Any] = {}
+        self._broadcast_handlers: dict[str, Callable[[dict[str, Any]], None]] = {
+            EVT_OBJECT_UPDATE: self._handle_object_update,
+        }
 
     @property
     def client(self) -> PushokHubClient | None:
@@ -98,10 +161,115 @@ class PushokHubCoordinator(DataUpdateCoordinator[dict[str, DeviceState]]):
         Returns:
             DeviceAdapter if found, None otherwise
         """
-        device = self._devices.get(device_id)
-        if device and device.driver:
-            return self._adapters.get(device.driver)
-        return None
+        return self._device_adapters.get(device_id)
+
+    def platform_fields(
+        self, platform: Platform
+    ) -> list[tuple[DeviceDescription, int]]:
+        """Get the fields a platform creates entities for.
+
+        Args:
+            platform: Field-based platform (sensor, binary_sensor, switch,
+                number or select)
+
+        Returns:
+            List of (device, field ID) pairs
+        """
+        return self._platform_fields.get(platform, [])
+
+    def detect_platforms(self) -> set[Platform]:
+        """Detect platforms that may have entities for the loaded devices.
+
+        Field-based platforms are included when they have fields; the light
+        check is a coarse superset and the platform applies its own finer
+        filters during setup.
+
+        Returns:
+            Set of platforms to set up
+        """
+        platforms = {
+            platform for platform, fields in self._platform_fields.items() if fields
+        }
+        if not self._devices:
+            return platforms
+
+        # Every device gets a link quality sensor
+        platforms.add(Platform.SENSOR)
+
+        if any(
+            adapter.device_type and (adapter.bool_ro or adapter.bool_rw)
+            for adapter in self._adapters.values()
+        ):
+            platforms.add(Platform.LIGHT)
+
+        return platforms
+
+    def _index_platform_fields(self, devices: list[DeviceDescription]) -> None:
+        """Resolve the fields of every field-based platform in one pass.
+
+        Adapter params are preferred (more complete info); the device format
+        is the fallback for devices without an adapter.
+
+        Args:
+            devices: Devices to index
+        """
+        sensors: list[tuple[DeviceDescription, int]] = []
+        binary_sensors: list[tuple[DeviceDescription, int]] = []
+        switches: list[tuple[DeviceDescription, int]] = []
+        numbers: list[tuple[DeviceDescription, int]] = []
+        selects: list[tuple[DeviceDescription, int]] = []
+
+        for device in devices:
+            adapter = self._device_adapters.get(device.id)
+            if adapter and adapter.params:
+                # Light devices are handled by the light platform
+                device_type = (adapter.device_type or "").lower()
+                is_light = _LIGHT_DEVICE_TYPE_RE.search(device_type) is not None
+
+                # The adapter pre-partitions its non-service params by type
+                # and access, so only the matching params are visited
+                binary_sensors.extend(
+                    (device, param.address) for param in adapter.bool_ro
+                )
+                sensors.extend((device, param.address) for param in adapter.numeric_ro)
+                if not is_light:
+                    switches.extend(
+                        (device, param.address) for param in adapter.bool_rw
+                    )
+                    # Dropdowns are handled by the select platform
+                    numbers.extend(
+                        (device, param.address)
+                        for param in adapter.numeric_rw
+                        if param.view_type in _NUMBER_VIEW_TYPES
+                    )
+                selects.extend((device, param.address) for param in adapter.dropdowns)
+                continue
+
+            fmt = self._formats.get(device.id)
+            if not fmt:
+                continue
+
+            sensors.extend((device, field_id) for field_id in fmt.sensor_field_ids)
+            for field_id, field_fmt in fmt.fields.items():
+                # Skip service fields (ID > MAX_FIELD_ID)
+                if field_id > MAX_FIELD_ID:
+                    continue
+                if field_fmt.is_read_only:
+                    if field_fmt.is_bool:
+                        binary_sensors.append((device, field_id))
+                else:
+                    if field_fmt.is_bool:
+                        switches.append((device, field_id))
+                    if field_fmt.is_numeric:
+                        numbers.append((device, field_id))
+
+        self._platform_fields = {
+            Platform.SENSOR: sensors,
+            Platform.BINARY_SENSOR: binary_sensors,
+            Platform.SWITCH: switches,
+            Platform.NUMBER: numbers,
+            Platform.SELECT: selects,
+        }
 
     async def async_setup(self) -> bool:
         """Set up the coordinator and connect to the hub.
@@ -122,7 +290,10 @@ class PushokHubCoordinator(DataUpdateCoordinator[dict[str, DeviceState]]):
         private_key = self.config_entry.data.get(STORAGE_KEY_PRIVATE_KEY)
         user_id = self.config_entry.data.get(STORAGE_KEY_USER_ID)
 
-        auth = PushokAuth(private_key_hex=private_key, user_id=user_id)
+        # Key loading/generation is CPU-bound, keep it off the event loop
+        auth = await self.hass.async_add_executor_job(
+            PushokAuth, private_key, user_id
+        )
 
         # Save generated keys if new
         if not private_key or not user_id:
@@ -142,7 +313,10 @@ class PushokHubCoordinator(DataUpdateCoordinator[dict[str, DeviceState]]):
             path=path,
             auth=auth,
         )
-        self._client.set_broadcast_callback(self._handle_broadcast)
+        # Route handled events straight to their handlers; anything else is
+        # dropped by the client without reaching the coordinator
+        for evt, handler in self._broadcast_handlers.items():
+            self._client.set_event_callback(evt, handler)
         self._client.set_connection_lost_callback(self._handle_connection_lost)
 
         try:
@@ -156,6 +330,8 @@ class PushokHubCoordinator(DataUpdateCoordinator[dict[str, DeviceState]]):
 
     async def async_shutdown(self) -> None:
         """Shutdown the coordinator."""
+        self._cancel_notify()
+
         if self._reconnect_task:
             self._reconnect_task.cancel()
             try:
@@ -167,81 +343,163 @@ class PushokHubCoordinator(DataUpdateCoordinator[dict[str, DeviceState]]):
             await self._client.disconnect()
 
     async def _load_devices(self) -> None:
-        """Load all devices from the hub."""
+        """Load all devices from the hub.
+
+        Device state is always refreshed. Formats, attributes and adapters
+        are cached across reconnects and only fetched for devices that are
+        new or whose CRC reported by the hub has changed.
+        """
         if not self._client:
             return
 
         # Get device list
         devices = await self._client.get_devices(ENTITY_TYPE_ZIGBEE)
+        previous = self._devices
         self._devices = {d.id: d for d in devices}
 
-        # Load state, format, and attributes for each device
-        states: dict[str, DeviceState] = {}
+        # Group devices by driver so adapters are handled once per driver
+        self._devices_by_driver = {}
+        for device in devices:
+            if device.driver:
+                self._devices_by_driver.setdefault(device.driver, []).append(device)
+
+        # Forget cached metadata of devices removed from the hub
+        for cache in (self._formats, self._attributes):
+            for device_id in cache.keys() - self._devices.keys():
+                del cache[device_id]
+
+        # Catalog and state requests are independent, so overlap them
+        _, states = await asyncio.gather(
+            self._load_device_catalog(previous),
+            self._refresh_states(),
+        )
 
-        for device_id, device in self._devices.items():
+        # Resolve each device's adapter once for get_adapter_for_device
+        self._device_adapters = {
+            device.id: adapter
+            for driver, driver_devices in self._devices_by_driver.items()
+            if (adapter := self._adapters.get(driver)) is not None
+            for device in driver_devices
+        }
+        self._index_platform_fields(devices)
+
+        self._cancel_notify()
+        self.async_set_updated_data(states)
+
+    async def _load_device_catalog(
+        self, previous: dict[str, DeviceDescription]
+    ) -> None:
+        """Load formats, attributes, and adapters that are missing or stale.
+
+        Args:
+            previous: Device descriptions from the previous load, used to
+                detect attribute changes by CRC
+        """
+        format_ids = [
+            device_id for device_id in self._devices if device_id not in self._formats
+        ]
+        attribute_ids = [
+            device_id
+            for device_id, device in self._devices.items()
+            if device_id not in self._attributes
+            or device_id not in previous
+            or previous[device_id].attr_crc != device.attr_crc
+        ]
+        # Load each driver's adapter once, not once per device, and refetch
+        # adapters whose content changed on the hub
+        drivers = []
+        for driver, driver_devices in self._devices_by_driver.items():
+            adapter = self._adapters.get(driver)
+            crc = driver_devices[0].adapter_crc
+            if adapter is None or (crc is not None and adapter.crc != crc):
+                drivers.append(driver)
+
+        formats, attributes, adapters = await asyncio.gather(
+            asyncio.gather(
+                *(
+                    self._limited(self._client.get_format, device_id)
+                    for device_id in format_ids
+                ),
+                return_exceptions=True,
+            ),
+            asyncio.gather(
+                *(
+                    self._limited(self._client.get_attributes, device_id)
+                    for device_id in attribute_ids
+                ),
+                return_exceptions=True,
+            ),
+            asyncio.gather(
+                *(self._limited(self._client.get_adapter, driver) for driver in drivers),
+                return_exceptions=True,
+            ),
+        )
+
+        for device_id, fmt in zip(format_ids, formats):
+            if isinstance(fmt, Exception):
+                _LOGGER.warning("Failed to load format for %s: %s", device_id, fmt)
+                continue
+            self._formats[device_id] = fmt
+
+        for device_id, attrs in zip(attribute_ids, attributes):
+            if isinstance(attrs, Exception):
+                _LOGGER.debug("No attributes for %s: %s", device_id, attrs)
+                continue
+            self._attributes[device_id] = attrs
             _LOGGER.debug(
-                "Processing device %s: model=%s, driver=%s",
+                "Loaded attributes for %s: name=%s",
                 device_id,
-                device.model,
-                device.driver,
+                attrs.name,
             )
 
-            # Load state
-            try:
-                state = await self._client.get_state(device_id)
-                states[device_id] = state
-            except Exception as e:
-                _LOGGER.warning("Failed to load state for %s: %s", device_id, e)
-
-            # Load format
-            try:
-                fmt = await self._client.get_format(device_id)
-                self._formats[device_id] = fmt
-            except Exception as e:
-                _LOGGER.warning("Failed to load format for %s: %s", device_id, e)
-
-            # Load attributes
-            try:
-                attrs = await self._client.get_attributes(device_id)
-                self._attributes[device_id] = attrs
-                _LOGGER.debug(
-                    "Loaded attributes for %s: name=%s",
-                    device_id,
-                    attrs.name,
+        for driver, adapter in zip(drivers, adapters):
+            if isinstance(adapter, Exception):
+                _LOGGER.warning(
+                    "Failed to load adapter for driver %s: %s",
+                    driver,
+                    adapter,
                 )
-            except Exception as e:
-                _LOGGER.debug("No attributes for %s: %s", device_id, e)
-
-            # Load adapter if device has a driver and not already cached
-            if device.driver and device.driver not in self._adapters:
-                try:
-                    adapter = await self._client.get_adapter(device.driver)
-                    self._adapters[device.driver] = adapter
-                    _LOGGER.debug(
-                        "Loaded adapter for driver %s: %s",
-                        device.driver,
-                        adapter.description,
-                    )
-                except Exception as e:
-                    _LOGGER.warning(
-                        "Failed to load adapter for driver %s: %s",
-                        device.driver,
-                        e,
-                    )
+                continue
+            self._adapters[driver] = adapter
+            # Sensor metadata of the driver's previous adapter is stale
+            for spec_key in [key for key in self.sensor_specs if key[0] == driver]:
+                del self.sensor_specs[spec_key]
+            _LOGGER.debug(
+                "Loaded adapter for driver %s: %s",
+                driver,
+                adapter.description,
+            )
 
-        self.async_set_updated_data(states)
+    async def _limited(
+        self, request: Callable[..., Awaitable[_T]], *args: Any
+    ) -> _T:
+        """Make a hub request within the concurrent request limit."""
+        async with self._request_limit:
+            return await request(*args)
 
-    @callback
-    def _handle_broadcast(self, data: dict[str, Any]) -> None:
-        """Handle broadcast message from hub.
+    async def _refresh_states(self) -> dict[str, DeviceState]:
+        """Fetch the current state of all devices.
 
-        Args:
-            data: Broadcast message data
+        Returns:
+            States keyed by device ID; devices that failed to load are omitted
         """
-        evt = data.get("evt")
+        device_ids = list(self._devices)
+        results = await asyncio.gather(
+            *(
+                self._limited(self._client.get_state, device_id)
+                for device_id in device_ids
+            ),
+            return_exceptions=True,
+        )
 
-        if evt == EVT_OBJECT_UPDATE:
-            self._handle_object_update(data)
+        states: dict[str, DeviceState] = {}
+        for device_id, state in zip(device_ids, results):
+            if isinstance(state, Exception):
+                _LOGGER.warning("Failed to load state for %s: %s", device_id, state)
+                continue
+            states[device_id] = state
+
+        return states
 
     @callback
     def _handle_object_update(self, data: dict[str, Any]) -> None:
@@ -251,13 +509,13 @@ class PushokHubCoordinator(DataUpdateCoordinator[dict[str, DeviceState]]):
             data: Object update data with format:
             {"id": "device_ieee", "type": "zigbee", "evt": "object_update", "props": {...}}
         """
-        device_id = data.get("id")  # Device IEEE address
-        props = data.get("props", {})
-
-        if not device_id:
-            _LOGGER.debug("Broadcast without device id")
+        parsed = _parse_object_update(data)
+        if parsed is None:
+            _LOGGER.debug("Malformed object update: %s", data)
             return
 
+        device_id, props = parsed  # Device IEEE address, changed properties
+
         if device_id not in self._devices:
             _LOGGER.debug("Update for unknown device: %s", device_id)
             return
@@ -272,36 +530,71 @@ class PushokHubCoordinator(DataUpdateCoordinator[dict[str, DeviceState]]):
         if "warn" in props:
             self._devices[device_id].warning = props["warn"]
 
-        # Update state
-        from .api.models import DeviceState, PropertyValue
-
-        current_data = dict(self.data) if self.data else {}
-        current_state = current_data.get(device_id)
+        # Update state in place; the mapping is owned by the coordinator, so
+        # there is no need to copy it on every broadcast
+        states = self.data if self.data is not None else {}
+        current_state = states.get(device_id)
 
         # Create state if it doesn't exist
-        if not current_state:
+        new_state = current_state is None
+        if new_state:
             current_state = DeviceState(device_id=device_id, properties={})
-            current_data[device_id] = current_state
-
-        # Update properties
-        for key, value in props.items():
-            if key.isdigit() and isinstance(value, dict):
-                field_id = int(key)
-                current_state.properties[field_id] = PropertyValue.from_dict(value)
-                _LOGGER.debug("Updated field %d = %s", field_id, value.get("value"))
+            states[device_id] = current_state
+
+        # Update properties (field IDs arrive as string keys with dict values;
+        # metadata keys like "lqi" carry scalars and are skipped cheaply).
+        # PropertyValue.from_dict is inlined to save a call per property.
+        current_state.properties.update(
+            {
+                int(key): PropertyValue(
+                    value.get("value"), value.get("time"), value.get("ack", False)
+                )
+                for key, value in props.items()
+                if isinstance(value, dict) and key.isdigit()
+            }
+        )
 
         if "adptr-crc" in props:
             current_state.adapter_crc = props["adptr-crc"]
 
-        # Notify listeners
-        self.async_set_updated_data(current_data)
+        # Notify listeners; a full data update is only needed when a new
+        # device state was added
+        if new_state:
+            # The full update notifies every listener, which covers any
+            # coalesced notification still pending
+            self._cancel_notify()
+            self.async_set_updated_data(states)
+        else:
+            self._schedule_notify()
+
+    @callback
+    def _schedule_notify(self) -> None:
+        """Notify listeners once for a burst of in-place state updates."""
+        if self._notify_handle is None:
+            self._notify_handle = self.hass.loop.call_later(
+                UPDATE_COALESCE, self._flush_notify
+            )
+
+    @callback
+    def _cancel_notify(self) -> None:
+        """Drop a pending coalesced notification."""
+        if self._notify_handle is not None:
+            self._notify_handle.cancel()
+            self._notify_handle = None
+
+    @callback
+    def _flush_notify(self) -> None:
+        """Notify listeners of coalesced state updates."""
+        self._notify_handle = None
+        self.async_update_listeners()
 
     def _handle_connection_lost(self) -> None:
         """Handle connection lost event from client."""
         _LOGGER.warning("Connection to hub lost, scheduling reconnect...")
 
-        # Schedule reconnect in the event loop
-        self.hass.loop.call_soon_threadsafe(self._schedule_reconnect)
+        # Schedule reconnect in the event loop; the first attempt is made
+        # right away since the disconnect was just observed
+        self.hass.loop.call_soon_threadsafe(self._schedule_reconnect, True)
 
         # Notify listeners that connection is lost (entities will mark as unavailable)
         self.hass.loop.call_soon_threadsafe(
@@ -313,34 +606,58 @@ class PushokHubCoordinator(DataUpdateCoordinator[dict[str, DeviceState]]):
         """Return True if hub is connected."""
         return self._client is not None and self._client.connected
 
-    def _schedule_reconnect(self) -> None:
-        """Schedule a reconnection attempt."""
+    def _schedule_reconnect(self, immediate: bool = False) -> None:
+        """Schedule a reconnection attempt.
+
+        Args:
+            immediate: Make the first attempt without waiting for the backoff
+        """
         if self._reconnect_task and not self._reconnect_task.done():
             return
 
-        self._reconnect_task = asyncio.create_task(self._reconnect_loop())
+        # Eager start runs the loop's synchronous prefix inline instead of
+        # waiting an extra event loop iteration for the task to be scheduled
+        self._reconnect_task = self.hass.async_create_background_task(
+            self._reconnect_loop(immediate),
+            name=f"{DOMAIN}_reconnect",
+            eager_start=True,
+        )
+
+    async def _reconnect_loop(self, immediate: bool = False) -> None:
+        """Attempt to reconnect to the hub.
+
+        Retries indefinitely with capped exponential backoff plus jitter, so
+        a hub that is down for a long time is not hammered with attempts.
+
+        Args:
+            immediate: Make the first attempt without waiting for the backoff
+        """
+        if not self._client:
+            return
 
-    async def _reconnect_loop(self) -> None:
-        """Attempt to reconnect to the hub."""
+        delay = 0.0 if immediate else RECONNECT_BASE
         while True:
-            await asyncio.sleep(RECONNECT_INTERVAL)
+            if delay:
+                await asyncio.sleep(delay + random.uniform(0, RECONNECT_BASE))
 
-            if self._client and self._client.connected:
+            if self._client.connected:
                 break
 
             _LOGGER.info("Attempting to reconnect to hub...")
 
             try:
-                if self._client:
-                    await self._client.disconnect()
-                    await self._client.connect()
-                    await self._load_devices()
-                    _LOGGER.info("Reconnected to hub")
-                    # Notify listeners that connection is restored
-                    self.async_set_updated_data(self.data)
-                    break
+                await self._client.disconnect()
+                await self._client.connect()
+                await self._load_devices()
+                _LOGGER.info("Reconnected to hub")
+                # Notify listeners that connection is restored
+                self.async_set_updated_data(self.data)
+                break
             except Exception as e:
-                _LOGGER.warning("Reconnection failed: %s", e)
+                delay = min(max(delay * 2, RECONNECT_BASE), RECONNECT_MAX)
+                _LOGGER.warning(
+                    "Reconnection failed: %s, retrying in ~%.0fs", e, delay
+                )
 
     async def async_set_device_state(
         self,
@@ -350,6 +667,10 @@ class PushokHubCoordinator(DataUpdateCoordinator[dict[str, DeviceState]]):
     ) -> bool:
         """Set device state.
 
+        Writes to the same field within WRITE_DEBOUNCE are collapsed into a
+        single setState carrying the latest value; all callers share its
+        result.
+
         Args:
             device_id: Device ID
             field: Field ID
@@ -361,4 +682,38 @@ class PushokHubCoordinator(DataUpdateCoordinator[dict[str, DeviceState]]):
         if not self._client:
             return False
 
+        key = (device_id, field)
+        self._pending_values[key] = value
+
+        task = self._pending_writes.get(key)
+        if task is None:
+            task = self.hass.async_create_task(
+                self._async_write_state(key),
+                name=f"{DOMAIN}_set_state",
+            )
+            self._pending_writes[key] = task
+
+        # Shield so a cancelled caller does not abort the write for others
+        return await asyncio.shield(task)
+
+    async def _async_write_state(self, key: tuple[str, int]) -> bool:
+        """Send the latest pending value for a field after the debounce window.
+
+        Args:
+            key: Tuple of (device_id, field)
+
+        Returns:
+            True if successful
+        """
+        try:
+            await asyncio.sleep(WRITE_DEBOUNCE)
+        finally:
+            # Writes arriving from here on start a new debounce window
+            del self._pending_writes[key]
+            value = self._pending_values.pop(key)
+
+        if not self._client:
+            return False
+
+        device_id, field = key
         return await self._client.set_state(device_id, field, value)
@@ -2,16 +2,122 @@
 
 from __future__ import annotations
 
-from typing import Any
+from functools import lru_cache
+import operator
+from typing import Any, Callable
 
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .api.models import AdapterParam, DeviceAdapter, DeviceDescription
+from .api.models import AdapterParam, DeviceAdapter, DeviceDescription, DeviceState
 from .const import DOMAIN, UNIT_MAPPING
 from .coordinator import PushokHubCoordinator
 
 
+def _identity(value: Any) -> Any:
+    """Return value unchanged (used when a param has no conversion rules)."""
+    return value
+
+
+def _rpn_div(a: float, b: float) -> float:
+    """Divide, yielding 0 for a zero divisor."""
+    return a / b if b != 0 else 0
+
+
+# RPN operator token -> binary function
+_RPN_OPERATORS: dict[str, Callable[[float, float], float]] = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": _rpn_div,
+}
+
+# Compiled RPN step kinds
+_RPN_SELF = 0
+_RPN_CONST = 1
+_RPN_OP = 2
+
+
+def _compile_rpn(rules: Any) -> Callable[[Any], Any]:
+    """Compile conversion rules into a callable, reusing identical rules.
+
+    Args:
+        rules: Conversion rules list (see _build_rpn)
+
+    Returns:
+        Callable applying the rules to a value
+    """
+    try:
+        return _compile_rpn_cached(tuple(rules))
+    except TypeError:
+        # Unhashable rule items; compile without caching
+        return _build_rpn(rules)
+
+
+@lru_cache(maxsize=256)
+def _compile_rpn_cached(rules: tuple) -> Callable[[Any], Any]:
+    """Compile hashable conversion rules (memoized)."""
+    return _build_rpn(rules)
+
+
+def _build_rpn(rules: Any) -> Callable[[Any], Any]:
+    """Translate RPN conversion rules into a callable.
+
+    Conversion rules are in RPN (Reverse Polish Notation) format:
+    ["self", 10.0, "/"] means: value / 10.0
+    ["self", 100.0, "*"] means: value * 100.0
+
+    The rules are decoded once; unknown tokens are ignored.
+
+    Args:
+        rules: Conversion rules list
+
+    Returns:
+        Callable applying the rules to a value
+    """
+    steps: list[tuple[int, Any]] = []
+    for item in rules:
+        if item == "self":
+            steps.append((_RPN_SELF, None))
+        elif isinstance(item, (int, float)):
+            steps.append((_RPN_CONST, float(item)))
+        elif isinstance(item, str) and item in _RPN_OPERATORS:
+            steps.append((_RPN_OP, _RPN_OPERATORS[item]))
+
+    if not steps:
+        return _identity
+
+    # Common shape: ["self", constant, operator]
+    if [kind for kind, _ in steps] == [_RPN_SELF, _RPN_CONST, _RPN_OP]:
+        constant = steps[1][1]
+        func = steps[2][1]
+
+        def apply_single(value: Any) -> Any:
+            return func(float(value), constant)
+
+        return apply_single
+
+    program = tuple(steps)
+
+    def apply_steps(value: Any) -> Any:
+        stack: list[float] = []
+        push = stack.append
+        pop = stack.pop
+        for kind, arg in program:
+            if kind == _RPN_SELF:
+                push(float(value))
+            elif kind == _RPN_CONST:
+                push(arg)
+            else:
+                # Replace the left operand in place instead of pop + append
+                b = pop()
+                stack[-1] = arg(stack[-1], b)
+        return stack[0] if stack else value
+
+    return apply_steps
+
+
 class PushokHubEntity(CoordinatorEntity[PushokHubCoordinator]):
     """Base entity for Pushok Hub devices."""
 
@@ -37,12 +143,44 @@ class PushokHubEntity(CoordinatorEntity[PushokHubCoordinator]):
         self._device = device
         self._field_id = field_id
         self._adapter_param: AdapterParam | None = None
+        # Device state snapshot, refreshed on each coordinator update
+        self._device_state: DeviceState | None = self._lookup_device_state()
 
-        # Try to get adapter param info
-        adapter = coordinator.get_adapter_for_device(device.id)
+        # Adapter is fixed for the entity's lifetime (entities are recreated
+        # on reload), so resolve it once for subclasses to reuse
+        adapter: DeviceAdapter | None = coordinator.get_adapter_for_device(device.id)
+        self._adapter = adapter
         if adapter:
             self._adapter_param = adapter.get_param_by_address(field_id)
 
+        # Conversion rules are fixed per param, so compile them once
+        self._from_device = self._compile_conversion(self._adapter_param, "conversion")
+        self._to_device = self._compile_conversion(self._adapter_param, "inversion")
+
+        # Read on every state write but fixed by the adapter param
+        self._extra_attributes = self._build_extra_attributes()
+
+        # Field value, converted once per coordinator update rather than on
+        # every property read
+        self._raw_value: Any = None
+        self._value: Any = None
+        self._refresh_field_value()
+        self._available = self._compute_available()
+
+        # Device info is only consumed when the entity is registered, so
+        # build it once instead of on every access
+        attrs = coordinator.attributes.get(device.id)
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, device.id)},
+            # Use name from hub attributes, fallback to model
+            name=attrs.name if attrs and attrs.name else device.model,
+            manufacturer=device.manufacturer,
+            model=device.model,
+            sw_version=device.driver,
+            # Get URL from adapter if available
+            configuration_url=adapter.url if adapter else None,
+        )
+
         # Unique ID: domain_device-ieee_field-id
         self._attr_unique_id = f"{DOMAIN}_{device.id}_{field_id}"
 
@@ -60,29 +198,13 @@ class PushokHubEntity(CoordinatorEntity[PushokHubCoordinator]):
         """Get the adapter parameter info for this entity."""
         return self._adapter_param
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        attrs = self.coordinator.attributes.get(self._device.id)
-        # Use name from hub attributes, fallback to model
-        name = attrs.name if attrs and attrs.name else self._device.model
-
-        # Get URL from adapter if available
-        adapter = self.coordinator.get_adapter_for_device(self._device.id)
-        config_url = adapter.url if adapter else None
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device.id)},
-            name=name,
-            manufacturer=self._device.manufacturer,
-            model=self._device.model,
-            sw_version=self._device.driver,
-            configuration_url=config_url,
-        )
-
     @property
     def available(self) -> bool:
         """Return if entity is available."""
+        return self._available
+
+    def _compute_available(self) -> bool:
+        """Check hub connection and device warning flag."""
         if not self.coordinator.client or not self.coordinator.client.connected:
             return False
 
@@ -95,6 +217,10 @@ class PushokHubEntity(CoordinatorEntity[PushokHubCoordinator]):
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return extra state attributes from adapter."""
+        return self._extra_attributes
+
+    def _build_extra_attributes(self) -> dict[str, Any] | None:
+        """Build extra state attributes from the (immutable) adapter param."""
         if not self._adapter_param:
             return None
 
@@ -134,14 +260,7 @@ class PushokHubEntity(CoordinatorEntity[PushokHubCoordinator]):
         if isinstance(value, bool):
             return value
 
-        if not self._adapter_param or not self._adapter_param.convert:
-            return value
-
-        conversion = self._adapter_param.convert.get("conversion")
-        if not conversion:
-            return value
-
-        return self._apply_conversion(value, conversion)
+        return self._from_device(value)
 
     def _convert_to_device(self, value: Any) -> Any:
         """Convert value to device using adapter inversion rules.
@@ -155,84 +274,77 @@ class PushokHubEntity(CoordinatorEntity[PushokHubCoordinator]):
         if value is None:
             return None
 
-        if not self._adapter_param or not self._adapter_param.convert:
-            return value
-
-        inversion = self._adapter_param.convert.get("inversion")
-        if not inversion:
-            return value
-
-        return self._apply_conversion(value, inversion)
-
-    def _apply_conversion(self, value: Any, rules: list) -> Any:
-        """Apply conversion rules to a value.
+        return self._to_device(value)
 
-        Conversion rules are in RPN (Reverse Polish Notation) format:
-        ["self", 10.0, "/"] means: value / 10.0
-        ["self", 100.0, "*"] means: value * 100.0
+    def _compile_conversion(
+        self, param: AdapterParam | None, direction: str
+    ) -> Callable[[Any], Any]:
+        """Bind a param's conversion rules to a callable once.
 
         Args:
-            value: Input value
-            rules: Conversion rules list
+            param: Adapter parameter (may be None)
+            direction: "conversion" (from device) or "inversion" (to device)
 
         Returns:
-            Converted value
+            Callable applying the rules, or identity if there are none
         """
+        if not param or not param.convert:
+            return _identity
+
+        rules = param.convert.get(direction)
         if not rules:
-            return value
+            return _identity
 
-        stack = []
-        for item in rules:
-            if item == "self":
-                stack.append(float(value))
-            elif isinstance(item, (int, float)):
-                stack.append(float(item))
-            elif item == "+":
-                b, a = stack.pop(), stack.pop()
-                stack.append(a + b)
-            elif item == "-":
-                b, a = stack.pop(), stack.pop()
-                stack.append(a - b)
-            elif item == "*":
-                b, a = stack.pop(), stack.pop()
-                stack.append(a * b)
-            elif item == "/":
-                b, a = stack.pop(), stack.pop()
-                stack.append(a / b if b != 0 else 0)
+        return _compile_rpn(rules)
 
-        return stack[0] if stack else value
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Snapshot this device's state, then write entity state."""
+        self._device_state = self._lookup_device_state()
+        self._refresh_field_value()
+        # Connection loss/restore and warning changes all notify listeners
+        self._available = self._compute_available()
+        super()._handle_coordinator_update()
 
-    @property
-    def _state_value(self):
-        """Get current state value for this field (with conversion)."""
-        if not self.coordinator.data:
-            return None
+    def _lookup_device_state(self) -> DeviceState | None:
+        """Get this device's state from the coordinator."""
+        data = self.coordinator.data
+        return data.get(self._device.id) if data else None
+
+    def _get_field_value(self, field_id: int) -> Any:
+        """Get raw value of a field from the device state snapshot.
 
-        state = self.coordinator.data.get(self._device.id)
-        if not state:
+        Args:
+            field_id: Field ID
+
+        Returns:
+            Raw value, or None if the field has no value
+        """
+        state = self._device_state
+        if state is None:
             return None
 
-        prop = state.properties.get(self._field_id)
-        if not prop:
+        prop = state.properties.get(field_id)
+        if prop is None:
             return None
 
-        return self._convert_from_device(prop.value)
+        return prop.value
+
+    def _refresh_field_value(self) -> None:
+        """Cache this field's raw and converted value from the snapshot."""
+        raw = self._get_field_value(self._field_id)
+        self._raw_value = raw
+        self._value = self._convert_from_device(raw)
+
+    @property
+    def _state_value(self):
+        """Get current state value for this field (with conversion)."""
+        return self._value
 
     @property
     def _raw_state_value(self):
         """Get current raw state value for this field (without conversion)."""
-        if not self.coordinator.data:
-            return None
-
-        state = self.coordinator.data.get(self._device.id)
-        if not state:
-            return None
-
-        prop = state.properties.get(self._field_id)
-        if not prop:
-            return None
-
-        return prop.value
+        return self._raw_value
 
     async def _async_set_value(self, value) -> None:
         """Set field value on the device (with conversion).
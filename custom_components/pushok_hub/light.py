@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import re
 from typing import Any
 
 from homeassistant.components.light import (
@@ -15,25 +16,36 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, MAX_FIELD_ID
+from .api.models import DeviceAdapter
+from .const import DOMAIN
 from .coordinator import PushokHubCoordinator
 from .entity import PushokHubEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+# Adapter device types handled by the light platform
+_LIGHT_TYPE_RE = re.compile(r"light|dimmer|bulb|led")
 
-def _find_light_fields(coordinator: PushokHubCoordinator, device_id: str) -> dict | None:
+# Param names (lowercase) identifying light fields
+_ON_OFF_NAMES = frozenset({"state", "on", "switch"})
+_BRIGHTNESS_NAMES = frozenset({"brightness", "level", "dim"})
+_COLOR_TEMP_NAMES = frozenset({"color_temp", "colortemp", "color_temperature"})
+_NUMERIC_TYPES = frozenset({"int", "float"})
+
+# Brightness rescaling tables (device 0-100 <-> HA 0-255), truncating like
+# int(value * 255 / 100) and int(value * 100 / 255)
+_PCT_TO_BRI = tuple(pct * 255 // 100 for pct in range(101))
+_BRI_TO_PCT = tuple(bri * 100 // 255 for bri in range(256))
+
+
+def _find_light_fields(adapter: DeviceAdapter) -> dict | None:
     """Find light-related fields from adapter.
 
     Returns dict with field IDs for on_off, brightness, color_temp if found.
     """
-    adapter = coordinator.get_adapter_for_device(device_id)
-    if not adapter:
-        return None
-
     # Check if device type is light-related
     device_type = (adapter.device_type or "").lower()
-    if not any(t in device_type for t in ["light", "dimmer", "bulb", "led"]):
+    if not _LIGHT_TYPE_RE.search(device_type):
         return None
 
     fields = {
@@ -42,23 +54,20 @@ def _find_light_fields(coordinator: PushokHubCoordinator, device_id: str) -> dic
         "color_temp": None,
     }
 
-    for param in adapter.params:
-        # Skip service fields (ID > MAX_FIELD_ID)
-        if param.address > MAX_FIELD_ID:
-            continue
-
+    # Service fields (ID > MAX_FIELD_ID) are already excluded
+    for param in adapter.public_params:
         name = (param.name or "").lower()
 
         # Find on/off field
-        if name in ("state", "on", "switch") and param.param_type == "bool":
+        if name in _ON_OFF_NAMES and param.param_type == "bool":
             fields["on_off"] = param.address
 
         # Find brightness field
-        if name in ("brightness", "level", "dim") and param.param_type in ("int", "float"):
+        elif name in _BRIGHTNESS_NAMES and param.param_type in _NUMERIC_TYPES:
             fields["brightness"] = param.address
 
         # Find color temperature field
-        if name in ("color_temp", "colortemp", "color_temperature") and param.param_type in ("int", "float"):
+        elif name in _COLOR_TEMP_NAMES and param.param_type in _NUMERIC_TYPES:
             fields["color_temp"] = param.address
 
     # Must have at least on/off to be a light
@@ -83,9 +92,16 @@ async def async_setup_entry(
     coordinator: PushokHubCoordinator = entry.runtime_data
 
     entities: list[PushokHubLight] = []
+    # Light fields depend only on the adapter, so resolve them once per driver
+    light_fields_by_driver: dict[str, dict | None] = {}
 
     for device_id, device in coordinator.devices.items():
-        light_fields = _find_light_fields(coordinator, device_id)
+        adapter = coordinator.get_adapter_for_device(device_id)
+        if not adapter:
+            continue
+        if adapter.driver not in light_fields_by_driver:
+            light_fields_by_driver[adapter.driver] = _find_light_fields(adapter)
+        light_fields = light_fields_by_driver[adapter.driver]
         if light_fields:
             entities.append(
                 PushokHubLight(
@@ -127,7 +143,7 @@ class PushokHubLight(PushokHubEntity, LightEntity):
         self._color_temp_field = color_temp_field
 
         # Store adapter params for brightness and color temp
-        adapter = coordinator.get_adapter_for_device(device.id)
+        adapter = self._adapter
         self._brightness_param = None
         self._color_temp_param = None
 
@@ -137,6 +153,20 @@ class PushokHubLight(PushokHubEntity, LightEntity):
             if color_temp_field is not None:
                 self._color_temp_param = adapter.get_param_by_address(color_temp_field)
 
+        # Bind conversion rules once so property reads don't re-resolve them
+        self._brightness_conv = self._compile_conversion(
+            self._brightness_param, "conversion"
+        )
+        self._brightness_inv = self._compile_conversion(
+            self._brightness_param, "inversion"
+        )
+        self._color_temp_conv = self._compile_conversion(
+            self._color_temp_param, "conversion"
+        )
+        self._color_temp_inv = self._compile_conversion(
+            self._color_temp_param, "inversion"
+        )
+
         # Determine color modes
         if color_temp_field is not None:
             self._attr_color_mode = ColorMode.COLOR_TEMP
@@ -168,27 +198,17 @@ class PushokHubLight(PushokHubEntity, LightEntity):
         if self._brightness_field is None:
             return None
 
-        if not self.coordinator.data:
-            return None
-
-        state = self.coordinator.data.get(self._device.id)
-        if not state:
-            return None
-
-        prop = state.properties.get(self._brightness_field)
-        if not prop:
+        value = self._get_field_value(self._brightness_field)
+        if value is None:
             return None
 
-        value = prop.value
-
-        # Apply conversion if available
-        if self._brightness_param and self._brightness_param.convert:
-            conversion = self._brightness_param.convert.get("conversion")
-            if conversion:
-                value = self._apply_conversion(value, conversion)
+        value = self._brightness_conv(value)
 
         # Convert to 0-255 range
         # Assume value is in 0-100 range after conversion
+        pct = int(value)
+        if pct == value and 0 <= pct <= 100:
+            return _PCT_TO_BRI[pct]
         return int(value * 255 / 100)
 
     @property
@@ -197,38 +217,17 @@ class PushokHubLight(PushokHubEntity, LightEntity):
         if self._color_temp_field is None:
             return None
 
-        if not self.coordinator.data:
-            return None
-
-        state = self.coordinator.data.get(self._device.id)
-        if not state:
-            return None
-
-        prop = state.properties.get(self._color_temp_field)
-        if not prop:
+        value = self._get_field_value(self._color_temp_field)
+        if value is None:
             return None
 
-        value = prop.value
-
-        # Apply conversion if available
-        if self._color_temp_param and self._color_temp_param.convert:
-            conversion = self._color_temp_param.convert.get("conversion")
-            if conversion:
-                value = self._apply_conversion(value, conversion)
-
-        return int(value)
+        return int(self._color_temp_conv(value))
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the light on."""
         # Handle color temperature
         if ATTR_COLOR_TEMP_KELVIN in kwargs and self._color_temp_field is not None:
-            color_temp = kwargs[ATTR_COLOR_TEMP_KELVIN]
-
-            # Apply inversion if available
-            if self._color_temp_param and self._color_temp_param.convert:
-                inversion = self._color_temp_param.convert.get("inversion")
-                if inversion:
-                    color_temp = self._apply_conversion(color_temp, inversion)
+            color_temp = self._color_temp_inv(kwargs[ATTR_COLOR_TEMP_KELVIN])
 
             await self.coordinator.async_set_device_state(
                 self._device.id,
@@ -239,13 +238,12 @@ class PushokHubLight(PushokHubEntity, LightEntity):
         # Handle brightness
         if ATTR_BRIGHTNESS in kwargs and self._brightness_field is not None:
             # Convert 0-255 to 0-100
-            brightness = int(kwargs[ATTR_BRIGHTNESS] * 100 / 255)
-
-            # Apply inversion if available
-            if self._brightness_param and self._brightness_param.convert:
-                inversion = self._brightness_param.convert.get("inversion")
-                if inversion:
-                    brightness = self._apply_conversion(brightness, inversion)
+            value = kwargs[ATTR_BRIGHTNESS]
+            if type(value) is int and 0 <= value <= 255:
+                pct = _BRI_TO_PCT[value]
+            else:
+                pct = int(value * 100 / 255)
+            brightness = self._brightness_inv(pct)
 
             await self.coordinator.async_set_device_state(
                 self._device.id,
@@ -6,10 +6,11 @@ import logging
 
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, MAX_FIELD_ID
+from .const import DOMAIN
 from .coordinator import PushokHubCoordinator
 from .entity import PushokHubEntity
 
@@ -30,42 +31,10 @@ async def async_setup_entry(
     """
     coordinator: PushokHubCoordinator = entry.runtime_data
 
-    entities: list[PushokHubNumber] = []
-
-    for device_id, device in coordinator.devices.items():
-        adapter = coordinator.get_adapter_for_device(device_id)
-        if adapter and adapter.params:
-            for param in adapter.params:
-                # Skip service fields (ID > MAX_FIELD_ID)
-                if param.address > MAX_FIELD_ID:
-                    continue
-                # Create number for numeric read-write params
-                if param.param_type in ("int", "float") and param.is_writable:
-                    view_type = param.view_params.get("type", "")
-                    # Skip dropdown (handled by select platform)
-                    if view_type == "dropdown":
-                        continue
-                    # Skip if device is a light (handled by light platform)
-                    device_type = (adapter.device_type or "").lower()
-                    if any(t in device_type for t in ["light", "dimmer", "bulb"]):
-                        continue
-                    # Create number for slider or value types
-                    if view_type in ("slider", "value"):
-                        entities.append(
-                            PushokHubNumber(coordinator, device, param.address)
-                        )
-        else:
-            # Fallback to format if no adapter
-            fmt = coordinator.formats.get(device_id)
-            if fmt:
-                for field_id, field_fmt in fmt.fields.items():
-                    # Skip service fields (ID > MAX_FIELD_ID)
-                    if field_id > MAX_FIELD_ID:
-                        continue
-                    if field_fmt.is_numeric and not field_fmt.is_read_only:
-                        entities.append(
-                            PushokHubNumber(coordinator, device, field_id)
-                        )
+    entities = [
+        PushokHubNumber(coordinator, device, field_id)
+        for device, field_id in coordinator.platform_fields(Platform.NUMBER)
+    ]
 
     async_add_entities(entities)
 
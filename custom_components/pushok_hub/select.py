@@ -6,10 +6,11 @@ import logging
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, MAX_FIELD_ID
+from .const import DOMAIN
 from .coordinator import PushokHubCoordinator
 from .entity import PushokHubEntity
 
@@ -30,21 +31,10 @@ async def async_setup_entry(
     """
     coordinator: PushokHubCoordinator = entry.runtime_data
 
-    entities: list[PushokHubSelect] = []
-
-    for device_id, device in coordinator.devices.items():
-        adapter = coordinator.get_adapter_for_device(device_id)
-        if adapter and adapter.params:
-            for param in adapter.params:
-                # Skip service fields (ID > MAX_FIELD_ID)
-                if param.address > MAX_FIELD_ID:
-                    continue
-                # Create select for params with dropdown viewType and labels
-                view_type = param.view_params.get("type", "")
-                if view_type == "dropdown" and param.labels and param.is_writable:
-                    entities.append(
-                        PushokHubSelect(coordinator, device, param.address)
-                    )
+    entities = [
+        PushokHubSelect(coordinator, device, field_id)
+        for device, field_id in coordinator.platform_fields(Platform.SELECT)
+    ]
 
     async_add_entities(entities)
 
@@ -56,14 +46,14 @@ class PushokHubSelect(PushokHubEntity, SelectEntity):
         """Initialize the select."""
         super().__init__(coordinator, device, field_id)
 
-        # Build options from labels
+        # Options come from labels; the lookups are shared with the adapter
+        # param (adapters are reused across devices with the same driver)
         self._label_to_value: dict[str, int | bool] = {}
         self._value_to_label: dict[int | bool, str] = {}
 
         if self._adapter_param and self._adapter_param.labels:
-            for label, value in self._adapter_param.labels.items():
-                self._label_to_value[label] = value
-                self._value_to_label[value] = label
+            self._label_to_value = self._adapter_param.labels
+            self._value_to_label = self._adapter_param.value_to_label
 
         self._attr_options = list(self._label_to_value.keys())
 
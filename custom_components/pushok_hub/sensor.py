@@ -7,19 +7,46 @@ import logging
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, MAX_FIELD_ID, SENSOR_DEVICE_CLASS_MAPPING
+from .const import DOMAIN, SENSOR_DEVICE_CLASS_MAPPING
 from .coordinator import PushokHubCoordinator
 from .entity import PushokHubEntity
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _build_device_class_map() -> dict[str, SensorDeviceClass]:
+    """Resolve SENSOR_DEVICE_CLASS_MAPPING to enum members once."""
+    device_classes: dict[str, SensorDeviceClass] = {}
+    for param_name, device_class_str in SENSOR_DEVICE_CLASS_MAPPING.items():
+        try:
+            device_classes[param_name] = SensorDeviceClass(device_class_str)
+        except ValueError:
+            continue
+    return device_classes
+
+
+# Param name (lowercase) -> SensorDeviceClass
+_DEVICE_CLASS_BY_PARAM = _build_device_class_map()
+
+
+# Shared sensor metadata: (entity description, value -> label mapping)
+_SensorSpec = tuple[SensorEntityDescription, dict[int | bool, str]]
+
+# Fields without adapter info are plain measurements
+_FALLBACK_SPEC: _SensorSpec = (
+    SensorEntityDescription(key="field", state_class=SensorStateClass.MEASUREMENT),
+    {},
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -34,37 +61,16 @@ async def async_setup_entry(
     """
     coordinator: PushokHubCoordinator = entry.runtime_data
 
-    entities: list[PushokHubSensor] = []
-
-    for device_id, device in coordinator.devices.items():
-        # First try to use adapter params (more complete info)
-        adapter = coordinator.get_adapter_for_device(device_id)
-        if adapter and adapter.params:
-            for param in adapter.params:
-                # Skip service fields (ID > MAX_FIELD_ID)
-                if param.address > MAX_FIELD_ID:
-                    continue
-                # Create sensor for numeric read-only params
-                if param.param_type in ("int", "float") and not param.is_writable:
-                    entities.append(
-                        PushokHubSensor(coordinator, device, param.address)
-                    )
-        else:
-            # Fallback to format if no adapter
-            fmt = coordinator.formats.get(device_id)
-            if fmt:
-                for field_id, field_fmt in fmt.fields.items():
-                    # Skip service fields (ID > MAX_FIELD_ID)
-                    if field_id > MAX_FIELD_ID:
-                        continue
-                    if field_fmt.is_numeric and field_fmt.is_read_only:
-                        entities.append(
-                            PushokHubSensor(coordinator, device, field_id)
-                        )
+    entities: list[PushokHubSensor | PushokHubLQISensor] = [
+        PushokHubSensor(coordinator, device, field_id)
+        for device, field_id in coordinator.platform_fields(Platform.SENSOR)
+    ]
 
     # Add LQI sensor for each device
-    for device_id, device in coordinator.devices.items():
-        entities.append(PushokHubLQISensor(coordinator, device))
+    entities.extend(
+        PushokHubLQISensor(coordinator, device)
+        for device in coordinator.devices.values()
+    )
 
     async_add_entities(entities)
 
@@ -76,50 +82,66 @@ class PushokHubSensor(PushokHubEntity, SensorEntity):
         """Initialize the sensor."""
         super().__init__(coordinator, device, field_id)
 
-        # Build value to label mapping if labels exist
-        self._value_to_label: dict[int | bool, str] = {}
-        if self._adapter_param and self._adapter_param.labels:
-            for label, value in self._adapter_param.labels.items():
-                self._value_to_label[value] = label
+        spec = _FALLBACK_SPEC
+        adapter = self._adapter
+        if self._adapter_param and adapter:
+            # Metadata is identical for a field across devices of one driver,
+            # so the entry's sensors share one spec per (driver, CRC, field)
+            specs: dict[tuple[str, int, int], _SensorSpec] = coordinator.sensor_specs
+            spec_key = (adapter.driver, adapter.crc, field_id)
+            spec = specs.get(spec_key)
+            if spec is None:
+                spec = specs[spec_key] = self._build_spec()
+
+        self.entity_description, self._value_to_label = spec
+        self._is_enum = self.entity_description.device_class is SensorDeviceClass.ENUM
+
+    def _build_spec(self) -> _SensorSpec:
+        """Build sensor metadata from the adapter param."""
+        param = self._adapter_param
+
+        # Value to label mapping (empty if there are no labels)
+        value_to_label: dict[int | bool, str] = param.value_to_label
 
         unit = self._get_ha_unit()
+        key = str(self._field_id)
 
         # Distinguish pure enum params from numeric measurements that merely have
         # named threshold markers in `labels`. Float params and params carrying a
         # measurement unit are treated as numeric — their `labels` are ignored
         # for state purposes.
-        param_type = self._adapter_param.param_type if self._adapter_param else None
-        self._is_enum = bool(self._value_to_label) and param_type != "float" and not unit
-
-        if self._is_enum:
-            self._attr_device_class = SensorDeviceClass.ENUM
-            self._attr_options = sorted(set(self._value_to_label.values()))
-        else:
-            self._attr_state_class = SensorStateClass.MEASUREMENT
-
-            if self._adapter_param and self._adapter_param.name:
-                param_name = self._adapter_param.name.lower()
-                device_class_str = SENSOR_DEVICE_CLASS_MAPPING.get(param_name)
-                # Reconcile name-based class with actual unit. A param named
-                # "battery" can carry voltage (mV/V) on some drivers; HA will
-                # reject device_class=battery without unit "%".
-                raw_unit = (
-                    self._adapter_param.view_params.get("unit")
-                    if self._adapter_param else None
-                )
-                if device_class_str == "battery" and raw_unit and raw_unit != "unit_%":
-                    if raw_unit in ("unit_mV", "unit_voltage", "unit_V"):
-                        device_class_str = "voltage"
-                    else:
-                        device_class_str = None
-                if device_class_str:
-                    try:
-                        self._attr_device_class = SensorDeviceClass(device_class_str)
-                    except ValueError:
-                        pass
-
-            if unit:
-                self._attr_native_unit_of_measurement = unit
+        if value_to_label and param.param_type != "float" and not unit:
+            description = SensorEntityDescription(
+                key=key,
+                device_class=SensorDeviceClass.ENUM,
+                options=sorted(set(value_to_label.values())),
+            )
+            return description, value_to_label
+
+        device_class = None
+        if param.name:
+            device_class = _DEVICE_CLASS_BY_PARAM.get(param.name.lower())
+            # Reconcile name-based class with actual unit. A param named
+            # "battery" can carry voltage (mV/V) on some drivers; HA will
+            # reject device_class=battery without unit "%".
+            raw_unit = param.view_params.get("unit")
+            if (
+                device_class is SensorDeviceClass.BATTERY
+                and raw_unit
+                and raw_unit != "unit_%"
+            ):
+                if raw_unit in ("unit_mV", "unit_voltage", "unit_V"):
+                    device_class = SensorDeviceClass.VOLTAGE
+                else:
+                    device_class = None
+
+        description = SensorEntityDescription(
+            key=key,
+            device_class=device_class,
+            state_class=SensorStateClass.MEASUREMENT,
+            native_unit_of_measurement=unit,
+        )
+        return description, value_to_label
 
     @property
     def native_value(self):
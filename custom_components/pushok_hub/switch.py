@@ -3,19 +3,76 @@
 from __future__ import annotations
 
 import logging
+import re
+from functools import lru_cache
 from typing import Any
 
 from homeassistant.components.switch import SwitchDeviceClass, SwitchEntity
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, MAX_FIELD_ID, SWITCH_DEVICE_CLASS_MAPPING
+from .const import DOMAIN, SWITCH_DEVICE_CLASS_MAPPING
 from .coordinator import PushokHubCoordinator
 from .entity import PushokHubEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+# Adapter device types that are outlets
+_OUTLET_TYPE_RE = re.compile(r"plug|socket")
+
+# Param name substring -> icon, checked in order
+_ICON_BY_TOKEN = {
+    "indicator": "mdi:led-on",
+    "led": "mdi:led-on",
+    "child_lock": "mdi:lock",
+    "backlight": "mdi:lightbulb",
+}
+
+
+@lru_cache(maxsize=256)
+def _resolve_switch_class(
+    device_type: str | None, param_name: str | None
+) -> tuple[SwitchDeviceClass | None, str | None]:
+    """Resolve device class and icon for a switch.
+
+    Many switches share a device type and param name, so results are cached.
+
+    Args:
+        device_type: Lowercase adapter device type, if there is an adapter
+        param_name: Lowercase adapter param name, if known
+
+    Returns:
+        Tuple of (device class, icon); either may be None
+    """
+    device_class = None
+
+    # Set device class based on adapter device type or param name
+    if device_type is not None:
+        if _OUTLET_TYPE_RE.search(device_type):
+            device_class = SwitchDeviceClass.OUTLET
+        elif "switch" in device_type:
+            device_class = SwitchDeviceClass.SWITCH
+
+    if device_class is None and param_name:
+        device_class_str = SWITCH_DEVICE_CLASS_MAPPING.get(param_name)
+        if device_class_str:
+            try:
+                device_class = SwitchDeviceClass(device_class_str)
+            except ValueError:
+                pass
+
+    # Set icon for common switch types
+    icon = None
+    if param_name:
+        for token, token_icon in _ICON_BY_TOKEN.items():
+            if token in param_name:
+                icon = token_icon
+                break
+
+    return device_class, icon
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -31,37 +88,10 @@ async def async_setup_entry(
     """
     coordinator: PushokHubCoordinator = entry.runtime_data
 
-    entities: list[PushokHubSwitch] = []
-
-    for device_id, device in coordinator.devices.items():
-        # First try to use adapter params (more complete info)
-        adapter = coordinator.get_adapter_for_device(device_id)
-        if adapter and adapter.params:
-            for param in adapter.params:
-                # Skip service fields (ID > MAX_FIELD_ID)
-                if param.address > MAX_FIELD_ID:
-                    continue
-                # Create switch for boolean read-write params
-                if param.param_type == "bool" and param.is_writable:
-                    # Skip if this is a light device (handled by light platform)
-                    device_type = (adapter.device_type or "").lower()
-                    if any(t in device_type for t in ["light", "dimmer", "bulb"]):
-                        continue
-                    entities.append(
-                        PushokHubSwitch(coordinator, device, param.address)
-                    )
-        else:
-            # Fallback to format if no adapter
-            fmt = coordinator.formats.get(device_id)
-            if fmt:
-                for field_id, field_fmt in fmt.fields.items():
-                    # Skip service fields (ID > MAX_FIELD_ID)
-                    if field_id > MAX_FIELD_ID:
-                        continue
-                    if field_fmt.is_bool and not field_fmt.is_read_only:
-                        entities.append(
-                            PushokHubSwitch(coordinator, device, field_id)
-                        )
+    entities = [
+        PushokHubSwitch(coordinator, device, field_id)
+        for device, field_id in coordinator.platform_fields(Platform.SWITCH)
+    ]
 
     async_add_entities(entities)
 
@@ -73,47 +103,29 @@ class PushokHubSwitch(PushokHubEntity, SwitchEntity):
         """Initialize the switch."""
         super().__init__(coordinator, device, field_id)
 
-        # Set device class based on param name or adapter device type
-        adapter = coordinator.get_adapter_for_device(device.id)
-        if adapter:
-            device_type = (adapter.device_type or "").lower()
-            if "plug" in device_type or "socket" in device_type:
-                self._attr_device_class = SwitchDeviceClass.OUTLET
-            elif "switch" in device_type:
-                self._attr_device_class = SwitchDeviceClass.SWITCH
-
-        # Try to set from param name
-        if not hasattr(self, "_attr_device_class") or self._attr_device_class is None:
-            if self._adapter_param and self._adapter_param.name:
-                param_name = self._adapter_param.name.lower()
-                device_class_str = SWITCH_DEVICE_CLASS_MAPPING.get(param_name)
-                if device_class_str:
-                    try:
-                        self._attr_device_class = SwitchDeviceClass(device_class_str)
-                    except ValueError:
-                        pass
-
-        # Set icon for common switch types
-        if self._adapter_param and self._adapter_param.name:
-            name = self._adapter_param.name.lower()
-            if "indicator" in name or "led" in name:
-                self._attr_icon = "mdi:led-on"
-            elif "child_lock" in name:
-                self._attr_icon = "mdi:lock"
-            elif "backlight" in name:
-                self._attr_icon = "mdi:lightbulb"
+        device_class, icon = _resolve_switch_class(
+            (self._adapter.device_type or "").lower() if self._adapter else None,
+            self._adapter_param.name.lower()
+            if self._adapter_param and self._adapter_param.name
+            else None,
+        )
+        if device_class is not None:
+            self._attr_device_class = device_class
+        if icon is not None:
+            self._attr_icon = icon
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the switch is on."""
         value = self._state_value
-        _LOGGER.debug(
-            "Switch %s field %d is_on check: raw=%s, converted=%s",
-            self._device.id[:8],
-            self._field_id,
-            self._raw_state_value,
-            value,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Switch %s field %d is_on check: raw=%s, converted=%s",
+                self._device.id[:8],
+                self._field_id,
+                self._raw_state_value,
+                value,
+            )
         if value is None:
             return None
         return bool(value)
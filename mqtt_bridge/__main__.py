@@ -9,20 +9,7 @@ import signal
 import sys
 from pathlib import Path
 
-import yaml
-
-# Auto-configure path for API module
-_this_dir = Path(__file__).parent.resolve()
-_project_root = _this_dir.parent
-_components_path = _project_root / "custom_components"
-
-# Add paths if not already present
-for path in [str(_project_root), str(_components_path)]:
-    if path not in sys.path:
-        sys.path.insert(0, path)
-
-from .bridge import PushokMqttBridge
-from .config import BridgeConfig
+from .config import BridgeConfig, dump_yaml, load_yaml
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -48,7 +35,7 @@ def save_keys_to_config(
 
     if path.exists():
         with open(path) as f:
-            data = yaml.safe_load(f) or {}
+            data = load_yaml(f) or {}
     else:
         data = {}
 
@@ -63,15 +50,15 @@ def save_keys_to_config(
         data["hub"]["port"] = port
 
     with open(path, "w") as f:
-        yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
+        dump_yaml(data, f)
 
     _LOGGER.info("Keys saved to %s", config_path)
 
 
 async def register_on_hub(config: BridgeConfig, config_path: str | None) -> bool:
     """Register on hub and save keys."""
-    from pushok_hub.api.auth import PushokAuth
-    from pushok_hub.api.client import PushokHubClient
+    from custom_components.pushok_hub.api.auth import PushokAuth
+    from custom_components.pushok_hub.api.client import PushokHubClient
 
     print("\n" + "=" * 50)
     print("REGISTRATION MODE")
@@ -221,25 +208,54 @@ Examples:
         print(f"  python -m mqtt_bridge --register -c {config_path or 'config.yaml'} --hub-host {config.hub.host}")
         sys.exit(1)
 
-    # Create and run bridge
-    bridge = PushokMqttBridge(config)
+    # Create and run bridge; paho and the hub client are only loaded here, so
+    # --help, --register and key errors skip them. The API package is imported
+    # as custom_components.pushok_hub.api; the project root is already on
+    # sys.path because mqtt_bridge itself was importable
+    from .bridge import PushokMqttBridge
 
-    # Handle shutdown signals
-    loop = asyncio.get_event_loop()
+    bridge = PushokMqttBridge(config)
 
-    def shutdown_handler():
-        asyncio.create_task(bridge.stop())
+    # Handle shutdown signals: stop waiting on the bridge and let the
+    # finally block stop it exactly once
+    loop = asyncio.get_running_loop()
+    stop_event = asyncio.Event()
 
     for sig in (signal.SIGINT, signal.SIGTERM):
-        loop.add_signal_handler(sig, shutdown_handler)
+        loop.add_signal_handler(sig, stop_event.set)
 
+    start_task = asyncio.create_task(bridge.start())
+    stop_task = asyncio.create_task(stop_event.wait())
     try:
-        await bridge.start()
+        await asyncio.wait(
+            {start_task, stop_task}, return_when=asyncio.FIRST_COMPLETED
+        )
     except KeyboardInterrupt:
         pass
     finally:
+        stop_task.cancel()
+        if not start_task.done():
+            start_task.cancel()
+            try:
+                await start_task
+            except asyncio.CancelledError:
+                pass
         await bridge.stop()
 
+    # Surface startup errors (e.g. hub unreachable) as before
+    if not start_task.cancelled():
+        start_task.result()
+
+
+def _install_uvloop() -> None:
+    """Use uvloop's event loop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 
 if __name__ == "__main__":
+    _install_uvloop()
     asyncio.run(main())
@@ -3,19 +3,20 @@
 from __future__ import annotations
 
 import asyncio
-import json
+from functools import lru_cache
 import logging
-import sys
+import math
+import operator
 import threading
-from pathlib import Path
-from typing import Any
-
-# Add parent directory to path for importing api module as package
-_root_path = Path(__file__).parent.parent
-sys.path.insert(0, str(_root_path))
+from typing import Any, Awaitable, Callable, NamedTuple, TypeVar
 
 from custom_components.pushok_hub.api.client import PushokHubClient
 from custom_components.pushok_hub.api.auth import PushokAuth
+from custom_components.pushok_hub.api.json_utils import (
+    JSONDecodeError,
+    json_dumps,
+    json_loads,
+)
 from custom_components.pushok_hub.api.models import (
     AdapterParam,
     DeviceAdapter,
@@ -24,6 +25,7 @@ from custom_components.pushok_hub.api.models import (
     DeviceState,
     PropertyValue,
 )
+from custom_components.pushok_hub.const import EVT_OBJECT_UPDATE
 
 import paho.mqtt.client as mqtt
 
@@ -31,6 +33,106 @@ from .config import BridgeConfig
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+
+# Hub unit names mapped to Home Assistant units for discovery
+_DISCOVERY_UNITS = {
+    "unit_C": "°C",
+    "unit_%": "%",
+    "unit_voltage": "V",
+    "unit_power": "W",
+    "unit_mA": "mA",
+}
+
+
+class _DiscoveryTemplate(NamedTuple):
+    """Device-independent part of a discovery entity for an adapter param."""
+
+    address: int
+    name: str  # Property name, as used in topics
+    title: str  # Entity display name
+    object_suffix: str  # object_id after the device name prefix
+    component: str
+    has_command: bool
+    extra: dict[str, Any]  # Component-specific payload fields
+
+
+def _identity(value: Any) -> Any:
+    """Return value unchanged (no conversion)."""
+    return value
+
+
+def _log10(value: Any, operand: float) -> Any:
+    """Apply a 'log10' conversion (the operand is unused)."""
+    return math.log10(value) if value > 0 else 0
+
+
+# Conversion operations by formula name, applied as func(value, operand)
+_CONVERSION_OPS: dict[str, Callable[[Any, float], Any]] = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+    "^": operator.pow,
+    "log10": _log10,
+}
+
+
+def _compile_conversion(formula: Any) -> Callable[[Any], Any]:
+    """Compile a conversion formula into a callable, reusing identical ones.
+
+    Args:
+        formula: Formula list ['self', operand, operation]
+
+    Returns:
+        Callable applying the formula to a value
+    """
+    try:
+        return _compile_conversion_cached(tuple(formula))
+    except TypeError:
+        # Unhashable formula items; compile without caching
+        return _build_conversion(formula)
+
+
+@lru_cache(maxsize=256)
+def _compile_conversion_cached(formula: tuple) -> Callable[[Any], Any]:
+    """Compile a hashable conversion formula (memoized)."""
+    return _build_conversion(formula)
+
+
+def _build_conversion(formula: Any) -> Callable[[Any], Any]:
+    """Build the callable for a conversion formula.
+
+    Formula format: ['self', operand, operation]
+    - 'self' represents the value
+    - operand is a number
+    - operation is '+', '-', '*', '/', '^', 'log10'
+
+    Formulas that cannot be applied compile to the identity.
+    """
+    if not formula or len(formula) < 3:
+        return _identity
+
+    try:
+        # formula is like ['self', 100, '*'] or ['self', 100.0, '/']
+        operand = float(formula[1])
+        func = _CONVERSION_OPS.get(formula[2])
+    except (TypeError, ValueError) as e:
+        _LOGGER.warning("Invalid conversion %s: %s", formula, e)
+        return _identity
+    if func is None:
+        return _identity
+
+    def convert(value: Any) -> Any:
+        try:
+            return func(value, operand)
+        except (TypeError, ValueError) as e:
+            _LOGGER.warning("Failed to apply conversion %s to %s: %s", formula, value, e)
+            return value
+
+    return convert
+
 
 class PushokMqttBridge:
     """MQTT Bridge for Pushok Hub in Zigbee2MQTT format."""
@@ -38,7 +140,14 @@ class PushokMqttBridge:
     def __init__(self, config: BridgeConfig) -> None:
         """Initialize the bridge."""
         self._config = config
+        self._base_topic = config.mqtt.base_topic
+        # Prefix of all bridge topics, for routing incoming messages
+        self._topic_prefix = f"{self._base_topic}/"
+        # Window for collapsing a burst of updates to one device, in seconds
+        self._coalesce_interval = config.mqtt.coalesce_interval_ms / 1000
         self._hub_client: PushokHubClient | None = None
+        # Bounds per-device requests to the hub while loading devices
+        self._request_limit = asyncio.Semaphore(config.hub.max_concurrency)
         self._mqtt_client: mqtt.Client | None = None
         self._mqtt_connected = False
         self._loop: asyncio.AbstractEventLoop | None = None
@@ -46,8 +155,36 @@ class PushokMqttBridge:
         self._devices: dict[str, DeviceDescription] = {}
         self._attributes: dict[str, DeviceAttributes] = {}
         self._adapters: dict[str, DeviceAdapter] = {}
+        # Per-driver param lookup by lowercase name (case-insensitive topics)
+        self._params_by_lower_name: dict[str, dict[str, AdapterParam]] = {}
+        # Per-driver (property name, param, compiled conversion) by field ID
+        # for state publishing
+        self._publish_plans: dict[
+            str, dict[int, tuple[str, AdapterParam, Callable[[Any], Any]]]
+        ] = {}
         self._states: dict[str, DeviceState] = {}
 
+        # Pending coalesced state publishes and their changed fields by device ID
+        self._pending_publish: dict[str, asyncio.TimerHandle] = {}
+        self._pending_fields: dict[str, set[int]] = {}
+        # (state topic, availability topic, property prefix, ack prefix) by
+        # device ID; topics use the device ID, so they never change
+        self._topics: dict[str, tuple[str, str, str, str]] = {}
+        # Last published (values, ack statuses) by device ID
+        self._payload_cache: dict[str, tuple[dict[str, Any], dict[str, bool]]] = {}
+
+        # Per-driver discovery entity templates (see _build_discovery_templates)
+        self._discovery_templates: dict[str, list[_DiscoveryTemplate]] = {}
+        # Serialized discovery messages, rebuilt after devices are reloaded
+        self._discovery_messages: list[tuple[str, str]] | None = None
+
+        # MQTT commands handed from paho's thread to the event loop; a single
+        # task takes them in arrival order and starts a handler task for each
+        self._commands: asyncio.Queue | None = None
+        self._command_task: asyncio.Task | None = None
+        # Running command handlers; one slow device does not hold up others
+        self._command_handlers: set[asyncio.Task] = set()
+
         # Track last published payloads to ignore echo messages
         self._last_published: dict[str, str] = {}
 
@@ -57,17 +194,21 @@ class PushokMqttBridge:
         self._reconnect_interval = 10  # seconds
 
         self._running = False
+        # Set by stop(); start() waits on it instead of polling _running
+        self._stop_event = asyncio.Event()
 
     @property
     def base_topic(self) -> str:
         """Get base MQTT topic."""
-        return self._config.mqtt.base_topic
+        return self._base_topic
 
     async def start(self) -> None:
         """Start the bridge."""
         _LOGGER.info("Starting Pushok Hub MQTT Bridge")
         self._running = True
         self._loop = asyncio.get_event_loop()
+        self._commands = asyncio.Queue()
+        self._command_task = asyncio.create_task(self._process_commands())
 
         # Connect to hub
         await self._connect_hub()
@@ -75,10 +216,9 @@ class PushokMqttBridge:
         # Connect to MQTT
         self._connect_mqtt()
 
-        # Run main loop
+        # Run until stopped
         try:
-            while self._running:
-                await asyncio.sleep(1)
+            await self._stop_event.wait()
         except asyncio.CancelledError:
             pass
 
@@ -86,6 +226,7 @@ class PushokMqttBridge:
         """Stop the bridge."""
         _LOGGER.info("Stopping Pushok Hub MQTT Bridge")
         self._running = False
+        self._stop_event.set()
 
         # Cancel reconnect task
         if self._reconnect_task and not self._reconnect_task.done():
@@ -95,6 +236,24 @@ class PushokMqttBridge:
             except asyncio.CancelledError:
                 pass
 
+        # Stop processing MQTT commands
+        if self._command_task and not self._command_task.done():
+            self._command_task.cancel()
+            try:
+                await self._command_task
+            except asyncio.CancelledError:
+                pass
+        handlers = list(self._command_handlers)
+        for task in handlers:
+            task.cancel()
+        await asyncio.gather(*handlers, return_exceptions=True)
+
+        # Drop pending coalesced publishes
+        for handle in self._pending_publish.values():
+            handle.cancel()
+        self._pending_publish.clear()
+        self._pending_fields.clear()
+
         # Publish offline status before disconnecting
         self._publish_offline_status()
 
@@ -124,7 +283,11 @@ class PushokMqttBridge:
             use_ssl=self._config.hub.use_ssl,
             auth=auth,
         )
-        self._hub_client.set_broadcast_callback(self._handle_hub_broadcast)
+        # The client dispatches broadcasts on the event loop, so updates are
+        # handled inline rather than through a task per message
+        self._hub_client.set_event_callback(
+            EVT_OBJECT_UPDATE, self._handle_object_update
+        )
         self._hub_client.set_connection_lost_callback(self._handle_hub_connection_lost)
 
         await self._hub_client.connect()
@@ -141,33 +304,88 @@ class PushokMqttBridge:
 
         devices = await self._hub_client.get_devices("zigbee")
         self._devices = {d.id: d for d in devices}
+        self._discovery_messages = None
+        self._payload_cache.clear()
         _LOGGER.info("Loaded %d devices", len(self._devices))
 
-        for device_id, device in self._devices.items():
-            _LOGGER.debug("Processing device %s: %s", device_id, device.model)
+        # Requests are pipelined over one connection, up to the configured
+        # number in flight; each driver's adapter is fetched once, not once
+        # per device
+        device_ids = list(self._devices)
+        drivers = list(
+            {
+                device.driver: None
+                for device in self._devices.values()
+                if device.driver and device.driver not in self._adapters
+            }
+        )
 
-            # Load state
-            try:
-                state = await self._hub_client.get_state(device_id)
-                self._states[device_id] = state
-            except Exception as e:
-                _LOGGER.warning("Failed to load state for %s: %s", device_id, e)
+        states, attributes, adapters = await asyncio.gather(
+            asyncio.gather(
+                *(
+                    self._limited(self._hub_client.get_state, device_id)
+                    for device_id in device_ids
+                ),
+                return_exceptions=True,
+            ),
+            asyncio.gather(
+                *(
+                    self._limited(self._hub_client.get_attributes, device_id)
+                    for device_id in device_ids
+                ),
+                return_exceptions=True,
+            ),
+            asyncio.gather(
+                *(
+                    self._limited(self._hub_client.get_adapter, driver)
+                    for driver in drivers
+                ),
+                return_exceptions=True,
+            ),
+        )
 
-            # Load attributes
-            try:
-                attrs = await self._hub_client.get_attributes(device_id)
-                self._attributes[device_id] = attrs
-            except Exception as e:
-                _LOGGER.debug("No attributes for %s: %s", device_id, e)
+        for device_id, state in zip(device_ids, states):
+            if isinstance(state, Exception):
+                _LOGGER.warning("Failed to load state for %s: %s", device_id, state)
+                continue
+            self._states[device_id] = state
 
-            # Load adapter
-            if device.driver and device.driver not in self._adapters:
-                try:
-                    adapter = await self._hub_client.get_adapter(device.driver)
-                    self._adapters[device.driver] = adapter
-                    _LOGGER.debug("Loaded adapter %s", device.driver)
-                except Exception as e:
-                    _LOGGER.warning("Failed to load adapter %s: %s", device.driver, e)
+        for device_id, attrs in zip(device_ids, attributes):
+            if isinstance(attrs, Exception):
+                _LOGGER.debug("No attributes for %s: %s", device_id, attrs)
+                continue
+            self._attributes[device_id] = attrs
+
+        for driver, adapter in zip(drivers, adapters):
+            if isinstance(adapter, Exception):
+                _LOGGER.warning("Failed to load adapter %s: %s", driver, adapter)
+                continue
+            self._adapters[driver] = adapter
+            self._index_adapter(adapter)
+            _LOGGER.debug("Loaded adapter %s", driver)
+
+    async def _limited(
+        self, request: Callable[..., Awaitable[_T]], *args: Any
+    ) -> _T:
+        """Make a hub request within the concurrent request limit."""
+        async with self._request_limit:
+            return await request(*args)
+
+    def _index_adapter(self, adapter: DeviceAdapter) -> None:
+        """Build the param name index and publish plan for an adapter."""
+        by_lower_name: dict[str, AdapterParam] = {}
+        plan: dict[int, tuple[str, AdapterParam, Callable[[Any], Any]]] = {}
+        for address, param in adapter.params.items():
+            if param.name:
+                # First param with a given name wins, as in a linear scan
+                by_lower_name.setdefault(param.name.lower(), param)
+            if param.convert and "conversion" in param.convert:
+                conversion = _compile_conversion(param.convert["conversion"])
+            else:
+                conversion = _identity
+            plan[address] = (param.name or f"field_{address}", param, conversion)
+        self._params_by_lower_name[adapter.driver] = by_lower_name
+        self._publish_plans[adapter.driver] = plan
 
     def _handle_hub_connection_lost(self) -> None:
         """Handle connection lost event from hub client."""
@@ -187,7 +405,7 @@ class PushokMqttBridge:
         # All devices unavailable
         for device_id in self._devices:
             self._publish(
-                f"{self.base_topic}/{device_id}/availability",
+                self._device_topics(device_id)[1],
                 "offline",
                 retain=True,
             )
@@ -264,7 +482,8 @@ class PushokMqttBridge:
     def _on_mqtt_connect(self, client: mqtt.Client, userdata: Any,
                          flags: Any, reason_code: Any, properties: Any = None) -> None:
         """Handle MQTT connect."""
-        rc = reason_code.value if hasattr(reason_code, 'value') else int(reason_code)
+        # The client uses callback API v2, which always passes a ReasonCode
+        rc = reason_code.value
         if rc == 0:
             _LOGGER.info("Connected to MQTT broker")
             self._mqtt_connected = True
@@ -289,86 +508,108 @@ class PushokMqttBridge:
                             disconnect_flags: Any, reason_code: Any, properties: Any = None) -> None:
         """Handle MQTT disconnect."""
         self._mqtt_connected = False
-        rc = reason_code.value if hasattr(reason_code, 'value') else int(reason_code) if reason_code else 0
+        rc = reason_code.value
         _LOGGER.warning("Disconnected from MQTT broker (rc=%d)", rc)
 
     def _on_mqtt_message(self, client: mqtt.Client, userdata: Any,
                          message: mqtt.MQTTMessage) -> None:
         """Handle incoming MQTT message."""
         topic = message.topic
-        payload = message.payload.decode() if message.payload else ""
 
-        _LOGGER.debug("MQTT message: %s = %s", topic, payload)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("MQTT message: %s = %r", topic, message.payload)
 
         # Skip bridge topics and availability
         if "/bridge/" in topic or topic.endswith("/availability"):
             return
 
-        parts = topic.split("/")
-        if len(parts) < 2 or parts[0] != self.base_topic:
+        # Topic levels below {base}/ (the base topic may itself contain "/")
+        if not topic.startswith(self._topic_prefix):
             return
+        parts = topic[len(self._topic_prefix):].split("/")
+        num_parts = len(parts)
+
+        raw_payload = message.payload
 
         # Ignore echo of our own published messages
-        if topic in self._last_published and self._last_published[topic] == payload:
-            _LOGGER.debug("Ignoring echo message on %s", topic)
+        published = self._last_published.get(topic)
+        if published is not None and published == raw_payload.decode():
+            # Every retained state publish echoes back, so this is the hot path
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Ignoring echo message on %s", topic)
             return
 
+        device_id = parts[0]
+
         # Handle JSON set commands: {base}/{device_id}/set
-        if len(parts) == 3 and parts[2] == "set":
-            device_id = parts[1]
-            if self._loop:
-                asyncio.run_coroutine_threadsafe(
-                    self._handle_set_command(device_id, payload),
-                    self._loop
-                )
+        if num_parts == 2 and parts[1] == "set":
+            # The JSON parser takes bytes, so the payload is not decoded
+            self._queue_command(self._handle_set_command, device_id, raw_payload)
             return
 
+        payload = raw_payload.decode()
+
         # Handle individual property set: {base}/{device_id}/{property}/set
-        if len(parts) == 4 and parts[3] == "set":
-            device_id = parts[1]
-            prop_name = parts[2]
-            if self._loop:
-                asyncio.run_coroutine_threadsafe(
-                    self._handle_property_command(device_id, prop_name, payload),
-                    self._loop
-                )
+        if num_parts == 3 and parts[2] == "set":
+            prop_name = parts[1]
+            self._queue_command(
+                self._handle_property_command, device_id, prop_name, payload
+            )
             return
 
         # Handle individual property topic: {base}/{device_id}/{property}
-        if len(parts) == 3 and parts[2] != "set":
-            device_id = parts[1]
-            prop_name = parts[2]
+        if num_parts == 2:
+            prop_name = parts[1]
             device = self._devices.get(device_id)
             if device:
                 adapter = self._adapters.get(device.driver) if device.driver else None
                 if adapter:
                     param = self._get_param_by_name(adapter, prop_name)
                     if param and param.is_writable:
-                        if self._loop:
-                            asyncio.run_coroutine_threadsafe(
-                                self._handle_property_command(device_id, prop_name, payload),
-                                self._loop
-                            )
+                        self._queue_command(
+                            self._handle_property_command, device_id, prop_name, payload
+                        )
             return
 
         # Handle main device topic with JSON: {base}/{device_id}
-        if len(parts) == 2:
-            device_id = parts[1]
+        if num_parts == 1:
             device = self._devices.get(device_id)
             if device and payload:
                 try:
-                    data = json.loads(payload)
+                    data = json_loads(payload)
                     adapter = self._adapters.get(device.driver) if device.driver else None
                     if adapter and self._has_writable_params(adapter, data):
                         _LOGGER.debug("Processing command from main topic: %s", topic)
-                        if self._loop:
-                            asyncio.run_coroutine_threadsafe(
-                                self._handle_set_command(device_id, payload),
-                                self._loop
-                            )
-                except json.JSONDecodeError:
+                        self._queue_command(self._handle_set_command, device_id, payload)
+                except JSONDecodeError:
                     pass
 
+    def _queue_command(
+        self, handler: Callable[..., Awaitable[None]], *args: Any
+    ) -> None:
+        """Queue a command handler call from the MQTT thread."""
+        if self._loop and self._commands is not None:
+            self._loop.call_soon_threadsafe(self._commands.put_nowait, (handler, args))
+
+    async def _process_commands(self) -> None:
+        """Start a task for each queued MQTT command handler call."""
+        commands = self._commands
+        handlers = self._command_handlers
+        while True:
+            handler, args = await commands.get()
+            task = asyncio.create_task(self._run_command(handler, args))
+            handlers.add(task)
+            task.add_done_callback(handlers.discard)
+
+    async def _run_command(
+        self, handler: Callable[..., Awaitable[None]], args: tuple[Any, ...]
+    ) -> None:
+        """Run an MQTT command handler, logging its failure."""
+        try:
+            await handler(*args)
+        except Exception:
+            _LOGGER.exception("Failed to handle command for %s", args[0])
+
     async def _on_mqtt_ready(self) -> None:
         """Called when MQTT is connected and ready."""
         # Publish bridge state
@@ -384,17 +625,7 @@ class PushokMqttBridge:
         if self._config.mqtt.discovery_enabled:
             self._publish_discovery()
 
-    def _handle_hub_broadcast(self, data: dict[str, Any]) -> None:
-        """Handle broadcast message from hub."""
-        evt = data.get("evt")
-        if evt == "object_update":
-            if self._loop:
-                asyncio.run_coroutine_threadsafe(
-                    self._handle_object_update(data),
-                    self._loop
-                )
-
-    async def _handle_object_update(self, data: dict[str, Any]) -> None:
+    def _handle_object_update(self, data: dict[str, Any]) -> None:
         """Handle object update from hub."""
         device_id = data.get("id")
         props = data.get("props", {})
@@ -403,19 +634,46 @@ class PushokMqttBridge:
             return
 
         device = self._devices[device_id]
-        _LOGGER.debug("Update for %s: %s", self._get_friendly_name(device), props)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Update for %s: %s", self._get_friendly_name(device), props)
 
         # Update state
         state = self._states.get(device_id)
-        if state:
-            for key, value in props.items():
-                if key.isdigit() and isinstance(value, dict):
-                    state.properties[int(key)] = PropertyValue.from_dict(value)
+        if not state:
+            return
 
-        # Publish to MQTT
-        self._publish_device_state(device)
+        # Only value and ack reach MQTT; updates that change neither (e.g. a
+        # refreshed timestamp) need no publish
+        changed: set[int] = set()
+        properties = state.properties
+        for key, value in props.items():
+            if key.isdigit() and isinstance(value, dict):
+                field_id = int(key)
+                new = PropertyValue.from_dict(value)
+                old = properties.get(field_id)
+                properties[field_id] = new
+                if old is None or old.value != new.value or old.ack != new.ack:
+                    changed.add(field_id)
+
+        if not changed:
+            return
+        self._pending_fields.setdefault(device_id, set()).update(changed)
 
-    async def _handle_set_command(self, device_id: str, payload: str) -> None:
+        # Publish to MQTT once per burst of updates for this device
+        if device_id not in self._pending_publish and self._loop:
+            self._pending_publish[device_id] = self._loop.call_later(
+                self._coalesce_interval, self._flush_device_publish, device_id
+            )
+
+    def _flush_device_publish(self, device_id: str) -> None:
+        """Publish a device's state after its coalescing window."""
+        self._pending_publish.pop(device_id, None)
+        changed = self._pending_fields.pop(device_id, None)
+        device = self._devices.get(device_id)
+        if device:
+            self._publish_device_state(device, changed)
+
+    async def _handle_set_command(self, device_id: str, payload: str | bytes) -> None:
         """Handle set command for device (JSON payload with multiple properties)."""
         device = self._devices.get(device_id)
         if not device:
@@ -423,8 +681,8 @@ class PushokMqttBridge:
             return
 
         try:
-            data = json.loads(payload)
-        except json.JSONDecodeError:
+            data = json_loads(payload)
+        except JSONDecodeError:
             _LOGGER.warning("Invalid JSON payload: %s", payload)
             return
 
@@ -472,8 +730,8 @@ class PushokMqttBridge:
         """Parse property value from string payload."""
         # Try JSON first
         try:
-            return json.loads(payload)
-        except json.JSONDecodeError:
+            return json_loads(payload)
+        except JSONDecodeError:
             pass
 
         # Handle boolean strings
@@ -508,12 +766,10 @@ class PushokMqttBridge:
             return param
 
         # Try lowercase
-        name_lower = name.lower()
-        for param in adapter.params:
-            if param.name and param.name.lower() == name_lower:
-                return param
-
-        return None
+        by_lower_name = self._params_by_lower_name.get(adapter.driver)
+        if by_lower_name is None:
+            return None
+        return by_lower_name.get(name.lower())
 
     def _convert_value_for_hub(self, param: AdapterParam, value: Any) -> Any:
         """Convert value from MQTT format to hub format.
@@ -541,61 +797,30 @@ class PushokMqttBridge:
 
         return converted
 
-    def _convert_value_from_hub(self, param: AdapterParam, value: Any) -> Any:
+    def _convert_value_from_hub(
+        self, param: AdapterParam, value: Any, conversion: Callable[[Any], Any]
+    ) -> Any:
         """Convert value from hub format to MQTT format.
 
-        - Applies conversion formula if defined
+        - Applies the param's compiled conversion formula
         - Converts numeric values to label strings
         """
-        converted = value
-
         # Apply conversion formula (for reading from hub)
-        if param.convert and "conversion" in param.convert:
-            converted = self._apply_conversion(converted, param.convert["conversion"])
+        converted = conversion(value)
 
         # Convert raw value to label
         if param.labels:
-            for label, label_value in param.labels.items():
-                if label_value == converted:
-                    return label
+            try:
+                return param.value_to_label.get(converted, converted)
+            except TypeError:
+                # Unhashable value; it cannot match a label
+                pass
 
         return converted
 
     def _apply_conversion(self, value: Any, formula: list) -> Any:
-        """Apply conversion formula to value.
-
-        Formula format: ['self', operand, operation]
-        - 'self' represents the value
-        - operand is a number
-        - operation is '+', '-', '*', '/', '^', 'log10'
-        """
-        import math
-
-        if not formula or len(formula) < 3:
-            return value
-
-        try:
-            # formula is like ['self', 100, '*'] or ['self', 100.0, '/']
-            operand = float(formula[1])
-            operation = formula[2]
-
-            if operation == '+':
-                return value + operand
-            elif operation == '-':
-                return value - operand
-            elif operation == '*':
-                result = value * operand
-                return int(result) if isinstance(operand, int) else result
-            elif operation == '/':
-                return value / operand
-            elif operation == '^':
-                return value ** operand
-            elif operation == 'log10':
-                return math.log10(value) if value > 0 else 0
-        except (TypeError, ValueError, IndexError) as e:
-            _LOGGER.warning("Failed to apply conversion %s to %s: %s", formula, value, e)
-
-        return value
+        """Apply conversion formula to value (see _build_conversion)."""
+        return _compile_conversion(formula)(value)
 
     def _has_writable_params(self, adapter: DeviceAdapter, data: dict[str, Any]) -> bool:
         """Check if data contains any writable parameters."""
@@ -617,11 +842,24 @@ class PushokMqttBridge:
         if self._mqtt_client and self._mqtt_connected:
             self._mqtt_client.publish(topic, payload, retain=retain)
 
+    def _device_topics(self, device_id: str) -> tuple[str, str, str, str]:
+        """Get (state, availability, property prefix, ack prefix) topics."""
+        topics = self._topics.get(device_id)
+        if topics is None:
+            state_topic = f"{self.base_topic}/{device_id}"
+            topics = self._topics[device_id] = (
+                state_topic,
+                f"{state_topic}/availability",
+                f"{state_topic}/",
+                f"{state_topic}/ack/",
+            )
+        return topics
+
     def _publish_bridge_state(self, state: str) -> None:
         """Publish bridge state."""
         self._publish(
             f"{self.base_topic}/bridge/state",
-            json.dumps({"state": state}),
+            json_dumps({"state": state}),
             retain=True,
         )
 
@@ -644,7 +882,7 @@ class PushokMqttBridge:
 
         self._publish(
             f"{self.base_topic}/bridge/devices",
-            json.dumps(devices_list),
+            json_dumps(devices_list),
             retain=True,
         )
 
@@ -653,77 +891,122 @@ class PushokMqttBridge:
         for device_id, device in self._devices.items():
             self._publish_device_state(device)
 
-    def _publish_device_state(self, device: DeviceDescription) -> None:
-        """Publish device state to MQTT."""
+    def _publish_device_state(
+        self, device: DeviceDescription, changed: set[int] | None = None
+    ) -> None:
+        """Publish device state to MQTT.
+
+        Args:
+            device: Device to publish
+            changed: Field IDs updated since the last publish; None rebuilds
+                and republishes every property
+        """
         state = self._states.get(device.id)
         if not state:
             return
 
-        adapter = self._adapters.get(device.driver) if device.driver else None
+        plan = self._publish_plans.get(device.driver) if device.driver else None
         friendly_name = self._get_friendly_name(device)
         device_id = device.id
 
-        # Build state payload and collect ack statuses
-        payload = {}
-        ack_statuses: dict[str, bool] = {}
-
-        for field_id, prop in state.properties.items():
-            name = self._get_param_name(adapter, field_id)
-            value = prop.value
+        # Converted values and ack statuses by property name, kept between
+        # publishes so an update only reconverts the fields it changed
+        cached = self._payload_cache.get(device_id)
+        full = cached is None or changed is None
+        if full:
+            values: dict[str, Any] = {}
+            ack_statuses: dict[str, bool] = {}
+            self._payload_cache[device_id] = (values, ack_statuses)
+            field_ids = state.properties.keys()
+        else:
+            values, ack_statuses = cached
+            field_ids = changed
+
+        # Properties whose converted value or ack status differs from the
+        # last publish (everything on a full publish)
+        value_names = []
+        ack_names = []
+        for field_id in field_ids:
+            prop = state.properties.get(field_id)
+            if prop is None:
+                continue
+            entry = plan.get(field_id) if plan else None
+            if entry is None:
+                # Field unknown to the adapter: publish the raw value
+                name = f"field_{field_id}"
+                value = prop.value
+            else:
+                name, param, conversion = entry
+                value = self._convert_value_from_hub(param, prop.value, conversion)
 
-            # Apply conversion if available
-            if adapter:
-                param = adapter.get_param_by_address(field_id)
-                if param:
-                    value = self._convert_value_from_hub(param, value)
+            if full or name not in values or values[name] != value:
+                values[name] = value
+                value_names.append(name)
+            if full or ack_statuses.get(name) != prop.ack:
+                ack_statuses[name] = prop.ack
+                ack_names.append(name)
 
-            payload[name] = value
-            ack_statuses[name] = prop.ack
+        # Use device_id in topic (more stable than friendly_name)
+        topic, availability_topic, prop_prefix, ack_prefix = self._device_topics(
+            device_id
+        )
 
-        # Add device metadata
-        payload["name"] = friendly_name
-        payload["linkquality"] = device.lqi
+        # A raw change can convert to the same value (e.g. the same label);
+        # the retained state is then already current
+        if full or value_names:
+            # Add device metadata
+            payload = dict(values)
+            payload["name"] = friendly_name
+            payload["linkquality"] = device.lqi
 
-        # Use device_id in topic (more stable than friendly_name)
-        topic = f"{self.base_topic}/{device_id}"
-        payload_str = json.dumps(payload)
+            payload_str = json_dumps(payload)
 
-        # Store for echo detection before publishing
-        self._last_published[topic] = payload_str
+            # Store for echo detection before publishing
+            self._last_published[topic] = payload_str
 
-        self._publish(topic, payload_str, retain=True)
+            self._publish(topic, payload_str, retain=True)
 
-        # Publish each property to separate topic
-        for prop_name, prop_value in payload.items():
-            prop_topic = f"{self.base_topic}/{device_id}/{prop_name}"
-            prop_payload = str(prop_value) if not isinstance(prop_value, str) else prop_value
-            self._last_published[prop_topic] = prop_payload
-            self._publish(prop_topic, prop_payload, retain=True)
+            # Publish each property to separate topic (retained, so unchanged
+            # properties only need publishing on a full rebuild)
+            prop_names = payload.keys() if full else value_names
+            for prop_name in prop_names:
+                prop_value = payload[prop_name]
+                prop_topic = prop_prefix + prop_name
+                prop_payload = str(prop_value) if not isinstance(prop_value, str) else prop_value
+                self._last_published[prop_topic] = prop_payload
+                self._publish(prop_topic, prop_payload, retain=True)
 
         # Publish ack status for each property
-        for prop_name, ack_value in ack_statuses.items():
-            ack_topic = f"{self.base_topic}/{device_id}/ack/{prop_name}"
-            ack_payload = "true" if ack_value else "false"
+        for prop_name in ack_names:
+            ack_topic = ack_prefix + prop_name
+            ack_payload = "true" if ack_statuses[prop_name] else "false"
             self._publish(ack_topic, ack_payload, retain=True)
 
-        # Publish availability
-        self._publish(
-            f"{self.base_topic}/{device_id}/availability",
-            "online" if not device.warning else "offline",
-            retain=True,
-        )
-
-    def _get_param_name(self, adapter: DeviceAdapter | None, field_id: int) -> str:
-        """Get parameter name by field ID."""
-        if adapter:
-            param = adapter.get_param_by_address(field_id)
-            if param and param.name:
-                return param.name
-        return f"field_{field_id}"
+        # Publish availability; it only changes when devices are reloaded,
+        # which makes the next publish a full one
+        if full:
+            self._publish(
+                availability_topic,
+                "online" if not device.warning else "offline",
+                retain=True,
+            )
 
     def _publish_discovery(self) -> None:
         """Publish Home Assistant MQTT discovery messages."""
+        # Payloads only change when devices are reloaded, so MQTT reconnects
+        # republish the serialized messages as-is
+        if self._discovery_messages is None:
+            self._discovery_messages = self._build_discovery_messages()
+
+        for topic, payload in self._discovery_messages:
+            self._publish(topic, payload, retain=True)
+
+        _LOGGER.info("Published MQTT discovery for %d devices", len(self._devices))
+
+    def _build_discovery_messages(self) -> list[tuple[str, str]]:
+        """Build (topic, JSON payload) discovery messages for all devices."""
         prefix = self._config.mqtt.discovery_prefix
+        messages: list[tuple[str, str]] = []
 
         for device_id, device in self._devices.items():
             adapter = self._adapters.get(device.driver) if device.driver else None
@@ -733,6 +1016,12 @@ class PushokMqttBridge:
             if not adapter or not state:
                 continue
 
+            templates = self._discovery_templates.get(adapter.driver)
+            if templates is None:
+                templates = self._discovery_templates[adapter.driver] = (
+                    self._build_discovery_templates(adapter)
+                )
+
             # Device info for discovery
             device_info = {
                 "identifiers": [device_id],
@@ -743,82 +1032,102 @@ class PushokMqttBridge:
             if adapter.url:
                 device_info["configuration_url"] = adapter.url
 
-            for param in adapter.params:
-                if param.address > 200:  # Skip service fields
-                    continue
-
-                entity_id = f"pushok_{device_id}_{param.address}"
-                name = param.name or f"field_{param.address}"
-
-                # Create safe object_id for HA entity_id
-                safe_name = name.lower().replace(" ", "_").replace("-", "_")
-                object_id = f"{friendly_name}_{safe_name}".lower().replace(" ", "_")
+            # Use device_id in topics (more stable than friendly_name)
+            device_topic = f"{self.base_topic}/{device_id}"
+            availability_topic = f"{device_topic}/availability"
+            object_prefix = f"{friendly_name}_".lower().replace(" ", "_")
 
-                # Use device_id in topics (more stable than friendly_name)
-                prop_state_topic = f"{self.base_topic}/{device_id}/{name}"
-                prop_command_topic = f"{self.base_topic}/{device_id}/{name}/set"
+            for template in templates:
+                prop_state_topic = f"{device_topic}/{template.name}"
 
                 config_payload = {
-                    "name": name.replace("_", " ").title(),
-                    "unique_id": entity_id,
-                    "object_id": object_id,
+                    "name": template.title,
+                    "unique_id": f"pushok_{device_id}_{template.address}",
+                    # Safe object_id for HA entity_id
+                    "object_id": object_prefix + template.object_suffix,
                     "state_topic": prop_state_topic,
                     "device": device_info,
-                    "availability_topic": f"{self.base_topic}/{device_id}/availability",
+                    "availability_topic": availability_topic,
                 }
+                if template.has_command:
+                    config_payload["command_topic"] = f"{prop_state_topic}/set"
+                config_payload.update(template.extra)
+
+                topic = (
+                    f"{prefix}/{template.component}/{device_id}/{template.address}/config"
+                )
+                messages.append((topic, json_dumps(config_payload)))
+
+        return messages
+
+    def _build_discovery_templates(
+        self, adapter: DeviceAdapter
+    ) -> list[_DiscoveryTemplate]:
+        """Build the discovery entity templates shared by an adapter's devices."""
+        templates: list[_DiscoveryTemplate] = []
 
-                # Determine component type
-                if param.param_type == "bool":
-                    # Get label values for on/off states (if defined)
-                    label_on = "on"
-                    label_off = "off"
-                    if param.labels:
-                        for label, val in param.labels.items():
-                            if val is True or val == 1:
-                                label_on = label
-                            elif val is False or val == 0:
-                                label_off = label
-
-                    if param.is_writable:
-                        component = "switch"
-                        config_payload["command_topic"] = prop_command_topic
-                        config_payload["payload_on"] = "true"
-                        config_payload["payload_off"] = "false"
-                        config_payload["state_on"] = label_on
-                        config_payload["state_off"] = label_off
-                    else:
-                        component = "binary_sensor"
-                        config_payload["payload_on"] = label_on
-                        config_payload["payload_off"] = label_off
-                elif param.param_type in ("int", "float"):
-                    if param.is_writable and param.view_params.get("type") == "dropdown":
-                        component = "select"
-                        config_payload["command_topic"] = prop_command_topic
-                        config_payload["options"] = list(param.labels.keys()) if param.labels else []
-                    elif param.is_writable:
-                        component = "number"
-                        config_payload["command_topic"] = prop_command_topic
-                        if param.min_value is not None:
-                            config_payload["min"] = param.min_value
-                        if param.max_value is not None:
-                            config_payload["max"] = param.max_value
-                    else:
-                        component = "sensor"
-                        unit = param.view_params.get("unit")
-                        if unit:
-                            # Map units
-                            unit_map = {
-                                "unit_C": "°C",
-                                "unit_%": "%",
-                                "unit_voltage": "V",
-                                "unit_power": "W",
-                                "unit_mA": "mA",
-                            }
-                            config_payload["unit_of_measurement"] = unit_map.get(unit, unit)
+        for param in adapter.params.values():
+            if param.address > 200:  # Skip service fields
+                continue
+
+            name = param.name or f"field_{param.address}"
+            safe_name = name.lower().replace(" ", "_").replace("-", "_")
+            extra: dict[str, Any] = {}
+            has_command = False
+
+            # Determine component type
+            if param.param_type == "bool":
+                # Get label values for on/off states (if defined)
+                label_on = "on"
+                label_off = "off"
+                if param.labels:
+                    for label, val in param.labels.items():
+                        if val is True or val == 1:
+                            label_on = label
+                        elif val is False or val == 0:
+                            label_off = label
+
+                if param.is_writable:
+                    component = "switch"
+                    has_command = True
+                    extra["payload_on"] = "true"
+                    extra["payload_off"] = "false"
+                    extra["state_on"] = label_on
+                    extra["state_off"] = label_off
                 else:
-                    continue
+                    component = "binary_sensor"
+                    extra["payload_on"] = label_on
+                    extra["payload_off"] = label_off
+            elif param.param_type in ("int", "float"):
+                if param.is_writable and param.view_params.get("type") == "dropdown":
+                    component = "select"
+                    has_command = True
+                    extra["options"] = list(param.labels.keys()) if param.labels else []
+                elif param.is_writable:
+                    component = "number"
+                    has_command = True
+                    if param.min_value is not None:
+                        extra["min"] = param.min_value
+                    if param.max_value is not None:
+                        extra["max"] = param.max_value
+                else:
+                    component = "sensor"
+                    unit = param.view_params.get("unit")
+                    if unit:
+                        extra["unit_of_measurement"] = _DISCOVERY_UNITS.get(unit, unit)
+            else:
+                continue
 
-                topic = f"{prefix}/{component}/{device_id}/{param.address}/config"
-                self._publish(topic, json.dumps(config_payload), retain=True)
+            templates.append(
+                _DiscoveryTemplate(
+                    param.address,
+                    name,
+                    name.replace("_", " ").title(),
+                    safe_name,
+                    component,
+                    has_command,
+                    extra,
+                )
+            )
 
-        _LOGGER.info("Published MQTT discovery for %d devices", len(self._devices))
+        return templates
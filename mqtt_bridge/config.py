@@ -5,12 +5,35 @@ from __future__ import annotations
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
-import yaml
 
+# PyYAML is imported on first use: configuration from environment variables
+# (the Docker default) never touches it.
+# The LibYAML C bindings are preferred when PyYAML was built with them.
 
-@dataclass
+
+def load_yaml(stream: IO[str]) -> Any:
+    """Parse a YAML document with the safe loader."""
+    import yaml
+
+    return yaml.load(stream, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def dump_yaml(data: Any, stream: IO[str]) -> None:
+    """Write data as block-style YAML with the safe dumper."""
+    import yaml
+
+    yaml.dump(
+        data,
+        stream,
+        Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+        default_flow_style=False,
+        allow_unicode=True,
+    )
+
+
+@dataclass(slots=True)
 class HubConfig:
     """Pushok Hub connection configuration."""
 
@@ -19,9 +42,11 @@ class HubConfig:
     use_ssl: bool = False
     private_key: str | None = None
     user_id: str | None = None
+    # Per-device requests in flight at once while loading devices
+    max_concurrency: int = 8
 
 
-@dataclass
+@dataclass(slots=True)
 class MqttConfig:
     """MQTT broker configuration."""
 
@@ -33,9 +58,11 @@ class MqttConfig:
     base_topic: str = "pushok_hub"
     discovery_prefix: str = "homeassistant"
     discovery_enabled: bool = True
+    # Window for collapsing a burst of updates to one device into one publish
+    coalesce_interval_ms: int = 50
 
 
-@dataclass
+@dataclass(slots=True)
 class BridgeConfig:
     """Bridge configuration."""
 
@@ -47,7 +74,7 @@ class BridgeConfig:
     def from_file(cls, path: str | Path) -> BridgeConfig:
         """Load configuration from YAML file."""
         with open(path) as f:
-            data = yaml.safe_load(f) or {}
+            data = load_yaml(f) or {}
 
         return cls.from_dict(data)
 
@@ -64,6 +91,7 @@ class BridgeConfig:
                 use_ssl=hub_data.get("use_ssl", False),
                 private_key=hub_data.get("private_key"),
                 user_id=hub_data.get("user_id"),
+                max_concurrency=hub_data.get("max_concurrency", 8),
             ),
             mqtt=MqttConfig(
                 host=mqtt_data.get("host", "localhost"),
@@ -74,6 +102,7 @@ class BridgeConfig:
                 base_topic=mqtt_data.get("base_topic", "pushok_hub"),
                 discovery_prefix=mqtt_data.get("discovery_prefix", "homeassistant"),
                 discovery_enabled=mqtt_data.get("discovery_enabled", True),
+                coalesce_interval_ms=mqtt_data.get("coalesce_interval_ms", 50),
             ),
             log_level=data.get("log_level", "INFO"),
         )
@@ -88,6 +117,7 @@ class BridgeConfig:
                 use_ssl=os.getenv("PUSHOK_HUB_SSL", "false").lower() == "true",
                 private_key=os.getenv("PUSHOK_HUB_PRIVATE_KEY"),
                 user_id=os.getenv("PUSHOK_HUB_USER_ID"),
+                max_concurrency=int(os.getenv("PUSHOK_HUB_MAX_CONCURRENCY", "8")),
             ),
             mqtt=MqttConfig(
                 host=os.getenv("MQTT_HOST", "localhost"),
@@ -98,6 +128,7 @@ class BridgeConfig:
                 base_topic=os.getenv("MQTT_BASE_TOPIC", "pushok_hub"),
                 discovery_prefix=os.getenv("MQTT_DISCOVERY_PREFIX", "homeassistant"),
                 discovery_enabled=os.getenv("MQTT_DISCOVERY_ENABLED", "true").lower() == "true",
+                coalesce_interval_ms=int(os.getenv("MQTT_COALESCE_INTERVAL_MS", "50")),
             ),
             log_level=os.getenv("LOG_LEVEL", "INFO"),
         )